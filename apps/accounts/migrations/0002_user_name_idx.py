@@ -0,0 +1,18 @@
+# Generated by Django 5.0.10 on 2026-10-16 21:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                fields=["first_name", "last_name"], name="accounts_us_first_n_ce4fe7_idx"
+            ),
+        ),
+    ]
@@ -62,6 +62,10 @@ class User(AbstractUser):
         verbose_name = _('user')
         verbose_name_plural = _('users')
         ordering = ['-date_joined']
+        indexes = [
+            # English: Employee tables order by user first/last name
+            models.Index(fields=['first_name', 'last_name']),
+        ]
 
     def __str__(self):
         return self.email
@@ -99,13 +103,29 @@ class User(AbstractUser):
         Returns:
             str or None: Profile picture URL or None
         """
-        if not self.profile_picture:
+        return self.profile_picture_url_for(self.profile_picture.name)
+
+    @classmethod
+    def profile_picture_url_for(cls, name):
+        """
+        Get profile picture URL for a stored file name.
+        English: Same rules as profile_picture_url, usable with values() rows
+        without building a User instance.
+
+        Args:
+            name: Stored file name (empty/None when no picture)
+
+        Returns:
+            str or None: Profile picture URL or None
+        """
+        if not name:
             return None
 
+        storage = cls._meta.get_field('profile_picture').storage
         try:
             # English: Check if file physically exists in storage
-            if self.profile_picture.storage.exists(self.profile_picture.name):
-                return self.profile_picture.url
+            if storage.exists(name):
+                return storage.url(name)
         except Exception:
             # English: Catch any storage errors (permissions, missing storage, etc.)
             pass
@@ -53,7 +53,7 @@ class LoginView(FormView):
             
             messages.success(
                 self.request,
-                _(f'Welcome back, {user.get_short_name()}!')
+                _('Welcome back, %(name)s!') % {'name': user.get_short_name()}
             )
             
             # Redirect to next parameter if exists
@@ -89,7 +89,7 @@ class SignupView(FormView):
         
         messages.success(
             self.request,
-            _(f'Account created successfully! Please log in.')
+            _('Account created successfully! Please log in.')
         )
         
         # Optionally: auto-login the user
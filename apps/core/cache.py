@@ -1,22 +1,27 @@
 # apps/core/cache.py
 from __future__ import annotations
 import hashlib
+import time
 from django.conf import settings
 from django.core.cache import cache
 
-def make_params_hash(params) -> str:
+# GET params that change the page/order but never the filtered set
+PAGINATION_PARAMS = frozenset({"page", "per_page", "ordering", "sort"})
+
+def make_params_hash(params, exclude=()) -> str:
     """
     Build a short stable hash of GET params.
-    Accepts QueryDict or dict.
+    Accepts QueryDict or dict. Keys in `exclude` are left out of the hash.
     """
     if hasattr(params, "items"):
         items = sorted((k, ",".join(v) if isinstance(v, list) else str(v))
-                       for k, v in params.lists()) if hasattr(params, "lists") else \
-                sorted((k, str(v)) for k, v in params.items())
+                       for k, v in params.lists() if k not in exclude) if hasattr(params, "lists") else \
+                sorted((k, str(v)) for k, v in params.items() if k not in exclude)
     else:
         items = []
     payload = "&".join(f"{k}={v}" for k, v in items)
-    return hashlib.md5(payload.encode("utf-8")).hexdigest()[:16]
+    # Non-cryptographic use: blake2b with an 8-byte digest is cheaper than md5+slice
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
 
 def make_key(*parts: str) -> str:
     """
@@ -26,6 +31,47 @@ def make_key(*parts: str) -> str:
     cleaned = [str(p).replace(" ", "_") for p in parts if p is not None]
     return ":".join([ns, *cleaned])
 
+# Stats versions live in the default cache. Without a CACHES setting that is
+# LocMemCache, which is private to each process: a bump in one worker does not
+# reach the others, whose entries stay until the stats TTL expires. Multi-worker
+# deployments need a shared backend (e.g. Redis or Memcached) for versions to work.
+
+def _stats_version_key(scope: str) -> str:
+    return make_key("stats", "ver", scope)
+
+def get_stats_version(scope: str) -> int:
+    """
+    Return the current stats version for `scope`, initialising it if missing.
+    Seeded from the clock so an evicted counter never reuses an old version.
+    """
+    key = _stats_version_key(scope)
+    ver = cache.get(key)
+    if ver is None:
+        cache.add(key, time.time_ns(), None)
+        ver = cache.get(key)
+    return ver
+
+def get_stats_versions(*scopes: str) -> tuple[int, ...]:
+    """
+    Return the current versions for several scopes in one cache round trip.
+    Only scopes missing from the cache fall back to get_stats_version().
+    """
+    keys = [_stats_version_key(scope) for scope in scopes]
+    found = cache.get_many(keys)
+    return tuple(found[key] if key in found else get_stats_version(scope)
+                 for scope, key in zip(scopes, keys))
+
+def bump_stats_version(scope: str) -> None:
+    """
+    Invalidate every stats entry keyed on `scope`'s version.
+    """
+    key = _stats_version_key(scope)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Counter not set yet (or evicted): start a fresh one
+        cache.add(key, time.time_ns(), None)
+
 def get_stats_ttl() -> int:
     return getattr(settings, "CACHE_TIMEOUTS", {}).get("stats", 300)
 
@@ -5,6 +5,12 @@ Core utility functions used across the application.
 from datetime import datetime, timedelta
 from typing import Optional
 
+from django.urls import reverse
+
+
+# Placeholder pk for URL templates - unlikely to occur elsewhere in a path
+URL_PK_PLACEHOLDER = 2147483647
+
 
 def calculate_hours_difference(start_time: datetime, end_time: datetime) -> float:
     """
@@ -61,4 +67,22 @@ def generate_employee_id(prefix: str = "EMP") -> str:
     date_str = timezone.now().strftime("%Y%m%d")
     random_suffix = f"{random.randint(0, 999):03d}"
     
-    return f"{prefix}-{date_str}-{random_suffix}"
\ No newline at end of file
+    return f"{prefix}-{date_str}-{random_suffix}"
+
+
+def pk_url_template(viewname: str, kwarg: str = "pk", **kwargs) -> str:
+    """
+    Reverse a URL once and return a str.format() template for one kwarg.
+    Lets row builders format per-row URLs without walking the resolver for
+    every row. Call per request so the script prefix is honoured.
+    
+    Args:
+        viewname: URL name (e.g., "employees:employee_detail")
+        kwarg: URL kwarg left as the "{}" slot (default: "pk")
+        **kwargs: Fixed URL kwargs shared by every row
+        
+    Returns:
+        str: URL template (e.g., "/employees/{}/")
+    """
+    url = reverse(viewname, kwargs={**kwargs, kwarg: URL_PK_PLACEHOLDER})
+    return url.replace(str(URL_PK_PLACEHOLDER), "{}")
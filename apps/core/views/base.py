@@ -1,15 +1,76 @@
 from django.conf import settings
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
 from django.views.generic import ListView
 
+
+class CountQuerysetPaginator(Paginator):
+    """
+    Paginator that can count a lighter queryset than the one it pages.
+    English: Annotated list querysets (GROUP BY over joins) make COUNT(*) wrap
+    the whole grouped query; count_queryset holds the same filters without
+    the annotations, so the total is a plain COUNT.
+    """
+
+    def __init__(self, object_list, per_page, count_queryset=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_queryset = count_queryset
+
+    @cached_property
+    def count(self):
+        """Total number of objects, across all pages."""
+        if self.count_queryset is None:
+            return super().count
+        return self.count_queryset.count()
+
+
 class BaseListView(ListView):
     """
     Base list view with default pagination and common mixins.
     English: All project list views should inherit from this.
     """
     paginate_by = getattr(settings, 'DEFAULT_PAGINATE_BY', 25)
+    paginator_class = CountQuerysetPaginator
     
     def get_paginate_by(self, queryset):
         """Allow per-view override via pagination_size attribute."""
         if hasattr(self, 'pagination_size'):
             return self.pagination_size
-        return self.paginate_by
\ No newline at end of file
+        return self.paginate_by
+
+    def filter_queryset(self, queryset):
+        """
+        Hook for filtering the base queryset.
+        English: FilterMixin overrides this with the request's filterset.
+        """
+        return queryset
+
+    def get_filtered_queryset(self):
+        """
+        Filtered base queryset, built once per request.
+        English: Views add table annotations on top of it in get_queryset(); the
+        paginator count and stats aggregates use it as is - no JOIN/GROUP BY.
+        """
+        if not hasattr(self, '_filtered_queryset'):
+            self._filtered_queryset = self.filter_queryset(super().get_queryset())
+        return self._filtered_queryset
+
+    def get_count_queryset(self):
+        """
+        Queryset used for the paginator's total count.
+        English: Filtered rows without the list annotations. get_queryset()
+        overrides must only annotate/order get_filtered_queryset(), not filter
+        it further, or override this too.
+        """
+        return self.get_filtered_queryset()
+
+    def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True, **kwargs):
+        """Pass the count queryset to the paginator."""
+        return self.paginator_class(
+            queryset,
+            per_page,
+            count_queryset=self.get_count_queryset(),
+            orphans=orphans,
+            allow_empty_first_page=allow_empty_first_page,
+            **kwargs,
+        )
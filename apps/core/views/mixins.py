@@ -15,8 +15,10 @@ class FilterMixin:
     
     def get_queryset(self):
         """Apply filters to queryset"""
-        queryset = super().get_queryset()
-        
+        return self.filter_queryset(super().get_queryset())
+    
+    def filter_queryset(self, queryset):
+        """Apply the filterset (if any) to queryset"""
         if self.filterset_class:
             self.filterset = self.filterset_class(data=self.request.GET)
             queryset = self.filterset.apply_filters(queryset)
@@ -72,7 +74,21 @@ class BreadcrumbMixin:
         return context
 
 
-class ProtectedDeleteMixin:
+class ReuseObjectMixin:
+    """Mixin for single-object views whose post() loads self.object before calling super()."""
+    
+    def get_object(self, queryset=None):
+        """
+        Reuse the object already loaded by post() for this request.
+        English: post() and DeleteView.post() both call get_object();
+        this avoids repeating the SELECT down the MRO.
+        """
+        if queryset is None and getattr(self, 'object', None) is not None:
+            return self.object
+        return super().get_object(queryset)
+
+
+class ProtectedDeleteMixin(ReuseObjectMixin):
     """
     Mixin for DeleteView to check for blocking references before deletion.
     
@@ -7,5 +7,5 @@ class EmployeesConfig(AppConfig):
     verbose_name = 'Employee Management'
     
     def ready(self):
-        # Import signals if needed
-        pass
\ No newline at end of file
+        # Import signals to register stats cache invalidation
+        from . import signals  # noqa: F401
\ No newline at end of file
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.10 on 2026-10-16 20:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("employees", "0012_rename_notes_to_description"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="employee",
+            index=models.Index(
+                fields=["location", "is_active"], name="employees_e_locatio_29e11b_idx"
+            ),
+        ),
+    ]
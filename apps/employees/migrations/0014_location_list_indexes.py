@@ -0,0 +1,24 @@
+# Generated by Django 5.0.10 on 2026-10-16 20:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("employees", "0013_employee_location_is_active_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="location",
+            index=models.Index(
+                fields=["is_active", "name"], name="employees_l_is_acti_d2bf1a_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="location",
+            index=models.Index(
+                fields=["manager", "is_active"], name="employees_l_manager_a8de25_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.0.10 on 2026-10-16 21:30
+
+from django.db import migrations
+
+# English: Trigram indexes for the location list search. icontains compiles to
+# UPPER(col::text) LIKE '%...%' on PostgreSQL, which a btree index can't serve.
+# They are PostgreSQL-only, so they are created here per backend instead of
+# being declared in Location.Meta (other backends keep plain LIKE scans).
+TRGM_INDEXES = (
+    ("employees_l_name_trgm", "name"),
+    ("employees_l_code_trgm", "code"),
+    ("employees_l_city_trgm", "city"),
+    ("employees_l_address_trgm", "address"),
+)
+
+
+def create_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    table = schema_editor.quote_name(apps.get_model("employees", "Location")._meta.db_table)
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, column in TRGM_INDEXES:
+        schema_editor.execute(
+            "CREATE INDEX IF NOT EXISTS %s ON %s USING gin (UPPER(%s) gin_trgm_ops)"
+            % (schema_editor.quote_name(index_name), table, schema_editor.quote_name(column))
+        )
+
+
+def drop_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    # English: pg_trgm itself is left installed - other objects may depend on it
+    for index_name, _column in TRGM_INDEXES:
+        schema_editor.execute("DROP INDEX IF EXISTS %s" % schema_editor.quote_name(index_name))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("employees", "0014_location_list_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trgm_indexes, drop_trgm_indexes),
+    ]
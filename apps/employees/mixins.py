@@ -1,9 +1,30 @@
 """
 Mixins for employee views.
 """
-from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.db.models import FloatField
+from django.db.models.functions import Cast
 from django.utils.translation import gettext_lazy as _
 
+from apps.core.utils import pk_url_template
+from .models import Employee
+
+
+# English: Shared table row constants - lazy labels, resolved when rendered
+
+# English: Status badge (text, color) keyed by is_active
+STATUS_BADGE = {
+    True: (_('Active'), 'success'),
+    False: (_('Inactive'), 'secondary'),
+}
+
+# English: Row action templates - copy with a per-row 'url'
+VIEW_ACTION = {'type': 'link', 'icon': 'visibility', 'title': _('View'), 'color': 'primary'}
+EDIT_ACTION = {'type': 'link', 'icon': 'edit', 'title': _('Edit'), 'color': 'secondary'}
+
+# English: Employment type code -> lazy display name (same source as get_employment_type_display)
+_EMPLOYMENT_TYPE_NAMES = dict(Employee._meta.get_field('employment_type').flatchoices)
+
 
 class EmployeeTableMixin:
     """
@@ -21,7 +42,58 @@ class EmployeeTableMixin:
         'rate',
         'actions'
     ]
-    
+
+    # English: values() keys read by prepare_employee_table_rows
+    # (rate/hours come from EMPLOYEE_TABLE_ANNOTATIONS)
+    EMPLOYEE_TABLE_FIELDS = (
+        'id',
+        'employee_id',
+        'is_active',
+        'employment_type',
+        'department_id',
+        'position_id',
+        'location_id',
+        'user__first_name',
+        'user__last_name',
+        'user__email',
+        'user__profile_picture',
+        'department__code',
+        'department__name',
+        'position__code',
+        'position__title',
+        'location__name',
+    )
+
+    # English: All available columns, keyed like DEFAULT_EMPLOYEE_COLUMNS
+    EMPLOYEE_TABLE_COLUMNS = {
+        'id': {'title': _('ID')},
+        'name': {'title': _('Name'), 'width': '35%'},
+        'department': {'title': _('Department'), 'width': '15%'},
+        'position': {'title': _('Position'), 'width': '15%'},
+        'type': {'title': _('Type'), 'width': '10%'},
+        'rate': {'title': _('Rate'), 'align': 'end'},
+        'actions': {'title': _('Actions'), 'width': '10%'},
+    }
+
+    # English: Decimal columns cast to float in SQL for the rate cell
+    EMPLOYEE_TABLE_ANNOTATIONS = {
+        'hourly_rate_f': Cast('hourly_rate', FloatField()),
+        'weekly_hours_f': Cast('weekly_hours', FloatField()),
+    }
+
+    def get_employee_table_queryset(self):
+        """
+        Get employee queryset for table rendering.
+        English: Plain dicts of only the columns used by the table rows - no model
+        instances are built for the employee or its related rows.
+
+        Returns:
+            QuerySet: Employee value dicts ordered by name
+        """
+        return Employee.objects.values(
+            *self.EMPLOYEE_TABLE_FIELDS, **self.EMPLOYEE_TABLE_ANNOTATIONS
+        ).order_by('user__first_name', 'user__last_name')
+
     def get_employee_table_columns(self, exclude=None):
         """
         Get table columns configuration.
@@ -35,22 +107,11 @@ class EmployeeTableMixin:
         """
         exclude = exclude or []
         
-        # English: All available columns
-        all_columns = {
-            'id': {'title': _('ID')},
-            'name': {'title': _('Name'), 'width': '35%'},
-            'department': {'title': _('Department'), 'width': '15%'},
-            'position': {'title': _('Position'), 'width': '15%'},
-            'type': {'title': _('Type'), 'width': '10%'},
-            'rate': {'title': _('Rate'), 'align': 'end'},
-            'actions': {'title': _('Actions'), 'width': '10%'},
-        }
-        
         # English: Build columns list maintaining order
         columns = []
         for col_key in self.DEFAULT_EMPLOYEE_COLUMNS:
             if col_key not in exclude:
-                columns.append(all_columns[col_key])
+                columns.append(self.EMPLOYEE_TABLE_COLUMNS[col_key])
         
         return columns
     
@@ -60,7 +121,7 @@ class EmployeeTableMixin:
         English: Converts Employee queryset to structured format for data_table component.
         
         Args:
-            employees: QuerySet of Employee objects
+            employees: Employee value dicts (see get_employee_table_queryset)
             exclude_columns: list of column keys to exclude
             
         Returns:
@@ -68,6 +129,12 @@ class EmployeeTableMixin:
         """
         exclude_columns = exclude_columns or []
         table_rows = []
+
+        # English: Resolve action URLs once per table, format the pk per row
+        detail_url = pk_url_template('employees:employee_detail')
+        update_url = pk_url_template('employees:employee_update')
+        # English: Resolved once per table - the f-string below would look it up per row
+        hrs_week = str(_('hrs/week'))
         
         for employee in employees:
             # English: Build cells dict
@@ -75,75 +142,69 @@ class EmployeeTableMixin:
             
             # ID cell
             if 'id' not in exclude_columns:
+                status_text, status_color = STATUS_BADGE[employee['is_active']]
                 cells_dict['id'] = {
                     'type': 'badge',
-                    'text': _('Active') if employee.is_active else _('Inactive'),
-                    'color': 'success' if employee.is_active else 'secondary',
-                    'subtitle': employee.employee_id
+                    'text': status_text,
+                    'color': status_color,
+                    'subtitle': employee['employee_id']
                 }
             
-            # Name cell (always included)
+            # Name cell (always included) - same fallback as User.get_full_name
+            full_name = f"{employee['user__first_name']} {employee['user__last_name']}".strip()
             cells_dict['name'] = {
                 'type': 'avatar',
-                'name': employee.user.get_full_name(),
-                'subtitle': employee.user.email,
-                'avatar_url': employee.user.profile_picture_url,
+                'name': full_name or employee['user__email'],
+                'subtitle': employee['user__email'],
+                'avatar_url': get_user_model().profile_picture_url_for(employee['user__profile_picture']),
             }
             
             # Department cell
             if 'department' not in exclude_columns:
+                has_department = employee['department_id'] is not None
                 cells_dict['department'] = {
                     'type': 'badge',
-                    'text': employee.department.code if employee.department else '—',
+                    'text': employee['department__code'] if has_department else '—',
                     'color': 'secondary',
-                    'name': employee.department.name if employee.department else None,
-                    'subtitle': employee.location.name if employee.location else None
+                    'name': employee['department__name'],
+                    'subtitle': employee['location__name']
                 }
 
             # Position cell
             if 'position' not in exclude_columns:
+                has_position = employee['position_id'] is not None
                 cells_dict['position'] = {
                     'type': 'badge',
-                    'text': employee.position.code if employee.position else '—',
+                    'text': employee['position__code'] if has_position else '—',
                     'color': 'info',
-                    'name': employee.position.title if employee.position else None
+                    'name': employee['position__title']
                 }
             
             # Type cell
             if 'type' not in exclude_columns:
+                employment_type = employee['employment_type']
                 cells_dict['type'] = {
                     'type': 'badge',
-                    'text': employee.get_employment_type_display(),
-                    'color': 'primary' if employee.employment_type == 'FT' else 'warning'
+                    'text': _EMPLOYMENT_TYPE_NAMES.get(employment_type, employment_type),
+                    'color': 'primary' if employment_type == 'FT' else 'warning'
                 }
             
             # Rate cell
             if 'rate' not in exclude_columns:
+                weekly_hours = employee['weekly_hours_f']
                 cells_dict['rate'] = {
                     'type': 'currency',
-                    'value': float(employee.hourly_rate) if employee.hourly_rate else 0,
+                    'value': employee['hourly_rate_f'] or 0,
                     'currency': 'CHF',
-                    'subtitle': f"{float(employee.weekly_hours):.2f} {_('hrs/week')}" if employee.weekly_hours else None
+                    'subtitle': f"{weekly_hours:.2f} {hrs_week}" if weekly_hours else None
                 }
             
             # Actions cell (always included)
             cells_dict['actions'] = {
                 'type': 'actions',
                 'actions': [
-                    {
-                        'type': 'link',
-                        'url': reverse('employees:employee_detail', kwargs={'pk': employee.pk}),
-                        'icon': 'visibility',
-                        'title': _('View'),
-                        'color': 'primary'
-                    },
-                    {
-                        'type': 'link',
-                        'url': reverse('employees:employee_update', kwargs={'pk': employee.pk}),
-                        'icon': 'edit',
-                        'title': _('Edit'),
-                        'color': 'secondary'
-                    }
+                    dict(VIEW_ACTION, url=detail_url.format(employee['id'])),
+                    dict(EDIT_ACTION, url=update_url.format(employee['id'])),
                 ]
             }
             
@@ -154,7 +215,7 @@ class EmployeeTableMixin:
                     cells.append(cells_dict[col_key])
             
             table_rows.append({
-                'id': employee.pk,
+                'id': employee['id'],
                 'cells': cells
             })
         
@@ -106,17 +106,32 @@ class Department(TimeStampedModel):
     
     @property
     def employee_count(self):
-        """Return total number of employees in this department."""
-        return self.employees.count()
+        """
+        Return total number of employees in this department.
+        English: Reads the ``total_employees`` annotation when present.
+        """
+        total = getattr(self, 'total_employees', None)
+        return total if total is not None else self.employees.count()
     
     @property
     def active_employee_count(self):
-        """Return number of active employees in this department."""
-        return self.employees.filter(is_active=True).count()
+        """
+        Return number of active employees in this department.
+        English: Reads the ``active_employees`` annotation when present.
+        """
+        active = getattr(self, 'active_employees', None)
+        return active if active is not None else self.employees.filter(is_active=True).count()
     
     @property
     def inactive_employee_count(self):
-        """Return number of inactive employees in this department."""
+        """
+        Return number of inactive employees in this department.
+        English: Derived from the count annotations when both are present.
+        """
+        total = getattr(self, 'total_employees', None)
+        active = getattr(self, 'active_employees', None)
+        if total is not None and active is not None:
+            return total - active
         return self.employees.filter(is_active=False).count()
     
     @property
@@ -436,6 +451,7 @@ class Employee(TimeStampedModel):
             models.Index(fields=['employee_id']),
             models.Index(fields=['department', 'is_active']),
             models.Index(fields=['position', 'is_active']),
+            models.Index(fields=['location', 'is_active']),
         ]
     
     def __str__(self):
@@ -738,6 +754,11 @@ class Location(TimeStampedModel):
             models.Index(fields=['code']),
             models.Index(fields=['is_active']),
             models.Index(fields=['city']),
+            # English: List view filters by status/manager and orders by name
+            models.Index(fields=['is_active', 'name']),
+            models.Index(fields=['manager', 'is_active']),
+            # English: PostgreSQL-only trigram indexes for the list search live in
+            # migration 0015 (created only on that backend)
         ]
 
     def __str__(self):
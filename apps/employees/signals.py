@@ -0,0 +1,46 @@
+from django.conf import settings
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.core.cache import bump_stats_version
+from apps.core.models import Address
+from .models import Employee, Department, Position, Location
+
+
+@receiver([post_save, post_delete], sender=Employee)
+def invalidate_employee_list_stats(*args, **kwargs):
+    # English: Bump the version so cached employee list stats are skipped
+    bump_stats_version('employee_list')
+
+
+@receiver([post_save, post_delete], sender=Department)
+def invalidate_department_list_stats(*args, **kwargs):
+    # English: Bump the version so cached department list stats are skipped
+    bump_stats_version('department_list')
+
+
+@receiver([post_save, post_delete], sender=Position)
+def invalidate_position_list_stats(*args, **kwargs):
+    # English: Bump the version so cached position list stats are skipped
+    bump_stats_version('position_list')
+
+
+@receiver([post_save, post_delete], sender=Location)
+def invalidate_location_list_stats(*args, **kwargs):
+    # English: Bump the version so cached location list stats are skipped
+    bump_stats_version('location_list')
+
+
+@receiver([post_save, post_delete], sender=Address)
+def invalidate_location_addresses(*args, **kwargs):
+    # English: Location rows show the flag of the linked address's country
+    bump_stats_version('location_list')
+
+
+@receiver([post_save, post_delete], sender=settings.AUTH_USER_MODEL)
+def invalidate_user_names(*args, update_fields=None, **kwargs):
+    # English: Bump the version so cached rows showing user names (e.g. location
+    # managers) are skipped; login-only saves of last_login don't change names
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    bump_stats_version('users')
@@ -1,3 +1,310 @@
-from django.test import TestCase
+import csv
+import datetime
+import io
+import json
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+
+from apps.core.cache import get_stats_version
+from apps.core.models import Address
+from apps.employees import views
+from apps.employees.models import Department, Position, Location, Employee, EmployeeDocument
+
+
+class EmployeeFixturesMixin:
+    """
+    Shared fixtures: one department, position and location plus a superuser.
+    English: The cache is cleared per test - stats versions and cached
+    fragments live in the process-wide LocMemCache.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = get_user_model().objects.create_superuser(
+            username='admin', email='admin@example.ch', password='pass',
+            first_name='Ada', last_name='Admin',
+        )
+        cls.department = Department.objects.create(name='Emergency', code='ER')
+        cls.position = Position.objects.create(
+            title='Registered Nurse', code='RN',
+            min_hourly_rate=Decimal('30.00'), max_hourly_rate=Decimal('50.00'),
+        )
+        cls.location = Location.objects.create(name='Main Clinic', code='MAIN')
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.admin)
+
+    def make_employee(self, employee_id, **kwargs):
+        """Create an employee with its own user account."""
+        user = get_user_model().objects.create_user(
+            username=employee_id, email=f'{employee_id.lower()}@example.ch', password='pass',
+            first_name='First', last_name=employee_id,
+        )
+        defaults = {
+            'department': self.department,
+            'position': self.position,
+            'location': self.location,
+            'hire_date': datetime.date(2020, 1, 1),
+            'hourly_rate': Decimal('40.00'),
+        }
+        defaults.update(kwargs)
+        return Employee.objects.create(user=user, employee_id=employee_id, **defaults)
+
+
+class EmployeeListStatsFragmentTests(EmployeeFixturesMixin, TestCase):
+    """Rendered stats fragment cache on the employee list."""
+
+    def test_fragment_hit_skips_stats_lookup(self):
+        self.make_employee('E001')
+        url = reverse('employees:employee_list')
+
+        with mock.patch.object(views, 'get_or_set_stats', wraps=views.get_or_set_stats) as stats:
+            self.client.get(url)
+            self.assertEqual(stats.call_count, 1)
+            response = self.client.get(url)
+            self.assertEqual(stats.call_count, 1)
+
+        self.assertContains(response, 'Total Employees')
+
+
+class LocationListRowsCacheTests(EmployeeFixturesMixin, TestCase):
+    """Cached location list table rows."""
+
+    def test_address_change_refreshes_cached_flag(self):
+        address = Address.objects.create(
+            address='Rue du Rhône 1', city='Genève', postal_code='1204', country='CH')
+        Location.objects.filter(pk=self.location.pk).update(address_detail=address)
+        url = reverse('employees:location_list')
+
+        self.assertContains(self.client.get(url), '🇨🇭')
+
+        address.country = 'CA'
+        address.save()
+
+        response = self.client.get(url)
+        self.assertContains(response, '🇨🇦')
+        self.assertNotContains(response, '🇨🇭')
+
+
+class EmployeeBulkActionPayloadTests(EmployeeFixturesMixin, TestCase):
+    """Payload size cap of employee_bulk_action."""
+
+    def setUp(self):
+        super().setUp()
+        self.url = reverse('employees:bulk_action')
+        self.payload = json.dumps({'action': 'archive', 'ids': list(range(1, 50))})
+
+    def test_oversized_content_length_is_rejected(self):
+        with mock.patch.object(views, 'BULK_MAX_BODY_BYTES', 100):
+            response = self.client.post(self.url, self.payload, content_type='application/json')
+        self.assertEqual(response.status_code, 413)
+
+    def test_oversized_body_without_content_length_is_rejected(self):
+        request = RequestFactory().post(self.url, self.payload, content_type='application/json')
+        # English: As with a chunked request body - no length header to check up front
+        del request.META['CONTENT_LENGTH']
+        request.user = self.admin
+
+        with mock.patch.object(views, 'BULK_MAX_BODY_BYTES', 100):
+            response = views.employee_bulk_action(request)
+        self.assertEqual(response.status_code, 413)
+
+
+class EmployeeCreatePasswordTests(EmployeeFixturesMixin, TestCase):
+    """New employee accounts get a per-user password and a setup link."""
+
+    def post_employee(self, employee_id, email):
+        return self.client.post(reverse('employees:employee_create'), {
+            'first_name': 'Nina', 'last_name': employee_id, 'email': email, 'country': 'CH',
+            'employee_id': employee_id,
+            'department': self.department.pk,
+            'position': self.position.pk,
+            'location': self.location.pk,
+            'employment_type': 'FT',
+            'hire_date': '2024-01-15',
+            'hourly_rate': '42.00',
+            'weekly_hours': '42.00',
+            'is_active': 'on',
+        })
+
+    def test_accounts_get_distinct_passwords_and_a_setup_email(self):
+        first = self.post_employee('E100', 'nina.e100@example.ch')
+        second = self.post_employee('E101', 'nina.e101@example.ch')
+        self.assertEqual(first.status_code, 302)
+        self.assertEqual(second.status_code, 302)
+
+        users = [Employee.objects.get(employee_id=eid).user for eid in ('E100', 'E101')]
+        self.assertTrue(all(user.has_usable_password() for user in users))
+        self.assertNotEqual(users[0].password, users[1].password)
+
+        self.assertEqual([message.to for message in mail.outbox],
+                         [['nina.e100@example.ch'], ['nina.e101@example.ch']])
+        self.assertIn('/accounts/reset/', mail.outbox[0].body)
+
+
+class StatsVersionSignalTests(EmployeeFixturesMixin, TestCase):
+    """Model writes bump the stats version of the lists that show them."""
+
+    def assertBumps(self, scope, write):
+        before = get_stats_version(scope)
+        write()
+        self.assertNotEqual(get_stats_version(scope), before, scope)
+
+    def test_save_and_delete_bump_sender_scope(self):
+        cases = [
+            ('employee_list', lambda: self.make_employee('E200')),
+            ('department_list', lambda: Department.objects.create(name='Cardiology', code='CARD')),
+            ('position_list', lambda: Position.objects.create(
+                title='Doctor', code='MD',
+                min_hourly_rate=Decimal('80.00'), max_hourly_rate=Decimal('120.00'))),
+            ('location_list', lambda: Location.objects.create(name='Annex', code='ANX')),
+            ('location_list', lambda: Address.objects.create(
+                address='Rue 1', city='Lausanne', postal_code='1003')),
+            ('users', lambda: get_user_model().objects.create_user(
+                username='u1', email='u1@example.ch', password='pass')),
+        ]
+        for scope, create in cases:
+            with self.subTest(scope=scope):
+                created = []
+                self.assertBumps(scope, lambda: created.append(create()))
+                obj = created[0]
+                self.assertBumps(scope, obj.save)
+                if isinstance(obj, Employee):
+                    # English: Employees are removed through their user account
+                    self.assertBumps(scope, obj.user.delete)
+                else:
+                    self.assertBumps(scope, obj.delete)
+
+    def test_last_login_only_save_does_not_bump_users(self):
+        before = get_stats_version('users')
+        self.admin.save(update_fields=['last_login'])
+        self.assertEqual(get_stats_version('users'), before)
+
+    def test_stale_stats_not_served_after_write(self):
+        url = reverse('employees:department_list')
+        response = self.client.get(url)
+        self.assertEqual(self._stat(response, 'Total Departments'), 1)
+
+        Department.objects.create(name='Cardiology', code='CARD')
+
+        response = self.client.get(url)
+        self.assertEqual(self._stat(response, 'Total Departments'), 2)
+
+    @staticmethod
+    def _stat(response, title):
+        """Value of the stats card with the given title."""
+        return next(card['value'] for card in response.context['stats_cards']
+                    if card['title'] == title)
+
+
+class EmployeeBulkDeleteTests(EmployeeFixturesMixin, TestCase):
+    """Bulk delete action of employee_bulk_action."""
+
+    def bulk_delete(self, ids):
+        response = self.client.post(
+            reverse('employees:bulk_action'),
+            json.dumps({'action': 'delete', 'ids': ids}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def block(self, employee):
+        """Give the employee a document - a blocking reference."""
+        EmployeeDocument.objects.create(
+            employee=employee, document_type='other', title='Contract',
+            file='employee_documents/contract.pdf',
+        )
+
+    def test_blocked_employee_is_skipped_and_reported(self):
+        blocked = self.make_employee('E300')
+        self.block(blocked)
+
+        data = self.bulk_delete([blocked.pk])
+
+        self.assertEqual(data['deleted'], 0)
+        self.assertEqual(data['blocked'], [blocked.pk])
+        self.assertTrue(Employee.objects.filter(pk=blocked.pk).exists())
+
+    def test_unblocked_employee_and_user_are_removed(self):
+        employee = self.make_employee('E301')
+        user_pk = employee.user_id
+
+        data = self.bulk_delete([employee.pk])
+
+        self.assertEqual(data['deleted'], 1)
+        self.assertEqual(data['blocked'], [])
+        self.assertFalse(Employee.objects.filter(pk=employee.pk).exists())
+        self.assertFalse(get_user_model().objects.filter(pk=user_pk).exists())
+
+    def test_selection_larger_than_batch_size(self):
+        employees = [self.make_employee(f'E31{n}') for n in range(5)]
+        self.block(employees[3])
+        ids = [employee.pk for employee in employees]
+
+        with mock.patch.object(views, 'BULK_BATCH_SIZE', 2):
+            data = self.bulk_delete(ids)
+
+        self.assertEqual(data['deleted'], 4)
+        self.assertEqual(data['blocked'], [employees[3].pk])
+        self.assertEqual(list(Employee.objects.filter(pk__in=ids)), [employees[3]])
+        self.assertEqual(
+            get_user_model().objects.filter(employee_profile__isnull=True, is_superuser=False).count(), 0)
+
+
+class EmployeeBulkExportArchiveTests(EmployeeFixturesMixin, TestCase):
+    """Export and archive actions of employee_bulk_action."""
+
+    def bulk_action(self, action, ids):
+        return self.client.post(
+            reverse('employees:bulk_action'),
+            json.dumps({'action': action, 'ids': ids}),
+            content_type='application/json',
+        )
+
+    def test_export_header_and_rows_ordered_by_employee_id(self):
+        employees = [self.make_employee(eid) for eid in ('E403', 'E401', 'E402')]
+        # English: Client order differs from employee_id order
+        ids = [employees[0].pk, employees[2].pk, employees[1].pk]
+
+        with mock.patch.object(views, 'BULK_BATCH_SIZE', 2):
+            response = self.bulk_action('export', ids)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = list(csv.reader(io.StringIO(b''.join(response.streaming_content).decode())))
+        self.assertEqual(rows[0], [header for header, _key in views.BULK_EXPORT_COLUMNS])
+        self.assertEqual([row[0] for row in rows[1:]], ['E401', 'E402', 'E403'])
+
+    def test_archive_deactivates_and_bumps_stats_version(self):
+        active = self.make_employee('E410')
+        other = self.make_employee('E411')
+        before = get_stats_version('employee_list')
+
+        response = self.bulk_action('archive', [active.pk])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['archived'], 1)
+        active.refresh_from_db()
+        other.refresh_from_db()
+        self.assertFalse(active.is_active)
+        self.assertTrue(other.is_active)
+        self.assertNotEqual(get_stats_version('employee_list'), before)
+
+    def test_unexpected_error_returns_generic_message(self):
+        employee = self.make_employee('E420')
+
+        with mock.patch.object(views, '_chunked', side_effect=RuntimeError('relation "secret_table" does not exist')), \
+                self.assertLogs('apps.employees.views', level='ERROR'):
+            response = self.bulk_action('archive', [employee.pk])
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json(), {'status': 'error', 'message': 'Bulk action failed'})
+        self.assertNotIn('secret_table', response.content.decode())
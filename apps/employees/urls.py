@@ -15,7 +15,7 @@ urlpatterns = [
     path('<int:pk>/edit/', views.EmployeeUpdateView.as_view(), name='employee_update'),
     path('<int:pk>/delete/', views.EmployeeDeleteView.as_view(), name='employee_delete'),
     
-    # Bulk actions (заглушка на данный момент). TODO: Implement bulk actions.
+    # Bulk actions (archive, delete, export)
     path('bulk-action/', views.employee_bulk_action, name='bulk_action'),
     
     # Document URLs
@@ -1,33 +1,194 @@
 """
 Views for employee management.
 """
+import csv
 import json
 import logging
 import os
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+
 from django.apps import apps
 from django.contrib import messages
+from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
 from django.db import transaction
-from django.db.models import Q, Count
-from django.http import HttpResponseRedirect, JsonResponse
+from django.db.models import CharField, IntegerField, OuterRef, Q, Count, Subquery, Value
+from django.db.models.functions import Coalesce, Concat, NullIf, Substr, Trim
+from django.http import HttpResponseRedirect, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render, redirect, get_object_or_404
-from django.urls import reverse_lazy, reverse
+from django.urls import get_script_prefix, reverse_lazy, reverse
+from django.utils import timezone
+from django.utils.crypto import get_random_string
+from django.utils.functional import SimpleLazyObject, cached_property
 from django.utils.safestring import mark_safe
-from django.utils.translation import gettext_lazy as _
+from django.utils.text import format_lazy
+from django.utils.translation import get_language, gettext_lazy as _
 from django.views.decorators.http import require_POST, require_http_methods
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView
 
+from apps.accounts.forms import ForgotPasswordForm
 from apps.core.views.base import BaseListView
-from apps.core.views.mixins import FilterMixin, BreadcrumbMixin, ProtectedDeleteMixin
+from apps.core.views.mixins import FilterMixin, BreadcrumbMixin, ProtectedDeleteMixin, ReuseObjectMixin
 from apps.employees.filters import DepartmentFilterSet, EmployeeFilterSet, PositionFilterSet, LocationFilterSet
-from apps.employees.mixins import EmployeeTableMixin  # ← Добавьте эту строку
+from apps.employees.mixins import EmployeeTableMixin, STATUS_BADGE, VIEW_ACTION, EDIT_ACTION
 from .models import Department, Location, Position, Employee, EmployeeDocument
 from .forms import (
     DepartmentForm, LocationForm, LocationSearchForm, PositionForm,
     EmployeeUserForm, EmployeeForm, EmployeeDocumentForm
 )
-from apps.core.cache import make_key, make_params_hash, get_or_set_stats
+from apps.core.utils import pk_url_template
+from apps.core.cache import (
+    PAGINATION_PARAMS, make_key, make_params_hash, get_or_set_stats,
+    get_stats_ttl, get_stats_version, get_stats_versions, bump_stats_version,
+)
+
+
+# ============================================
+# Shared table row constants
+# ============================================
+
+# English: Certification badge (text, color) keyed by requires_certification
+_CERTIFICATION_BADGE = {
+    True: (_('Required'), 'warning'),
+    False: (_('Not Required'), 'secondary'),
+}
+
+
+@lru_cache(maxsize=None)
+def _reverse_static(viewname, script_prefix):
+    return reverse(viewname)
+
+
+def _static_url(viewname):
+    """
+    reverse() for URLs without arguments, memoized per script prefix.
+    English: Breadcrumbs and headers resolve the same few list URLs on every
+    request; after the first call this is a dict lookup.
+    """
+    return _reverse_static(viewname, get_script_prefix())
+
+
+@lru_cache(maxsize=None)
+def _optional_model(app_label, model_name):
+    """
+    Model from an optional app, or None when the app/model is absent.
+    English: Resolved once per process instead of on every request.
+    """
+    if not apps.is_installed(f'apps.{app_label}'):
+        return None
+    try:
+        return apps.get_model(app_label, model_name)
+    except LookupError:
+        # English: Model doesn't exist yet
+        return None
+
+
+def _blocking_querysets(now):
+    """
+    Querysets of rows that block employee deletion, keyed by reference type.
+    English: Single rule set for EmployeeDeleteView and the bulk delete action;
+    optional apps only when installed. Every queryset links rows via `employee`.
+    """
+    counters = {}
+    Shift = _optional_model('schedules', 'Shift')
+    if Shift is not None:
+        counters['future_shifts'] = Shift.objects.filter(start_datetime__gte=now)
+    TimeEntry = _optional_model('timeclock', 'TimeEntry')
+    if TimeEntry is not None:
+        counters['open_timeclock'] = TimeEntry.objects.filter(clock_out__isnull=True)
+    counters['documents'] = EmployeeDocument.objects.all()
+    return counters
+
+
+def _employee_count(queryset):
+    """Correlated COUNT of `queryset` rows for the outer employee row (0 when none)."""
+    return Coalesce(Subquery(
+        queryset.filter(employee=OuterRef('pk')).order_by()
+        .values('employee').annotate(n=Count('pk')).values('n'),
+        output_field=IntegerField(),
+    ), 0)
+
+
+# English: Document type code -> lazy display name (same source as get_document_type_display)
+_DOCUMENT_TYPE_NAMES = dict(EmployeeDocument._meta.get_field('document_type').flatchoices)
+
+# English: Location country code -> lazy display name (same source as get_country_display)
+_LOCATION_COUNTRY_NAMES = dict(Location._meta.get_field('country').flatchoices)
+
+# English: Position list stats cards as (counts key, static card) - value added per call
+_POSITION_STATS_CARDS = (
+    ('total', {'title': _('Total Positions'), 'icon': 'work', 'bg_color': 'primary'}),
+    ('active', {'title': _('Active'), 'icon': 'check_circle', 'bg_color': 'success'}),
+    ('inactive', {'title': _('Inactive'), 'icon': 'cancel', 'bg_color': 'danger'}),
+    ('requires_cert', {'title': _('Requires Certification'), 'icon': 'verified', 'bg_color': 'info'}),
+)
+
+# English: Static location labels - only values/hrefs are filled per request
+_LOCATION_STATS_CARDS = (
+    ('total', {'title': _('Total Locations'), 'icon': 'location_on', 'bg_color': 'primary'}),
+    ('active', {'title': _('Active'), 'icon': 'check_circle', 'bg_color': 'success'}),
+    ('inactive', {'title': _('Inactive'), 'icon': 'cancel', 'bg_color': 'danger'}),
+    ('with_manager', {'title': _('With Manager'), 'icon': 'person', 'bg_color': 'info'}),
+)
+_LOCATION_TABLE_COLUMNS = (
+    {'title': _('Status'), 'width': '10%'},
+    {'title': _('Name'), 'width': '20%'},
+    {'title': _('Address'), 'width': '25%'},
+    {'title': _('Manager'), 'width': '15%'},
+    {'title': _('Active employees'), 'align': 'center', 'width': '10%'},
+    {'title': _('Total employees'), 'align': 'center', 'width': '10%'},
+    {'title': _('Actions'), 'width': '10%'},
+)
+_LOCATION_DETAIL_STATS_CARDS = (
+    ('total_employees', {'title': _('Total Employees'), 'icon': 'people', 'bg_color': 'primary'}),
+    ('active_employees', {'title': _('Active Employees'), 'icon': 'check_circle', 'bg_color': 'success'}),
+    ('inactive_employees', {'title': _('Inactive Employees'), 'icon': 'cancel', 'bg_color': 'secondary'}),
+)
+
+# English: Location form layout as (title, icon, ((field, col_class, toggle field), ...))
+_LOCATION_FORM_SECTIONS = (
+    (_('Basic Information'), 'info', (
+        ('name', 'col-md-6', None),
+        ('code', 'col-md-6', 'is_active'),
+    )),
+    (_('Address'), 'location_on', (
+        ('address', 'col-12', None),
+        ('address_line_2', 'col-12', None),
+        ('city', 'col-md-4', None),
+        ('postal_code', 'col-md-3', None),
+        ('state_province', 'col-md-2', None),
+        ('country', 'col-md-3', None),
+    )),
+    (_('Contact Information'), 'contact_phone', (
+        ('phone', 'col-md-6', None),
+        ('email', 'col-md-6', None),
+    )),
+    (_('Management'), 'admin_panel_settings', (
+        ('manager', 'col-md-6', None),
+        ('labor_budget', 'col-md-6', None),
+    )),
+    (_('Geolocation (Optional)'), 'map', (
+        ('latitude', 'col-md-6', None),
+        ('longitude', 'col-md-6', None),
+    )),
+    (_('Additional Information'), 'notes', (
+        ('description', 'col-12', None),
+    )),
+)
+
+# English: Static detail sidebar blocks - read-only, shared across requests
+_SIDEBAR_DIVIDER = MappingProxyType({'type': 'divider'})
+_SIDEBAR_BASIC_INFO_HEADER = MappingProxyType(
+    {'type': 'section_header', 'icon': 'info', 'title': _('Basic Information')})
+_SIDEBAR_MANAGEMENT_HEADER = MappingProxyType(
+    {'type': 'section_header', 'icon': 'person', 'title': _('Management')})
+_SIDEBAR_COMPENSATION_HEADER = MappingProxyType(
+    {'type': 'section_header', 'icon': 'payments', 'title': _('Compensation')})
+_SIDEBAR_REQUIREMENTS_HEADER = MappingProxyType(
+    {'type': 'section_header', 'icon': 'verified', 'title': _('Requirements')})
 
 
 # ============================================
@@ -43,20 +204,32 @@ class EmployeeListView(EmployeeTableMixin, FilterMixin, BreadcrumbMixin, LoginRe
     permission_required = 'employees.view_employee'
     filterset_class = EmployeeFilterSet
 
+    # English: Static empty-state parts; only button_url is filled per request
+    _EMPTY_STATE_FILTERED = {
+        'icon': 'filter_alt_off',
+        'title': _('No employees match your filters'),
+        'message': _('Try adjusting or clearing your filters to see more results'),
+        'button_text': _('Clear Filters'),
+    }
+    _EMPTY_STATE_NEW = {
+        'icon': 'people_outline',
+        'title': _('No employees found'),
+        'message': _('Start by adding your first employee'),
+        'button_text': _('Add First Employee'),
+    }
+
     def get_breadcrumbs(self):
         return [
-            {'label': _('Dashboard'), 'url': reverse('dashboard:home')},
+            {'label': _('Dashboard'), 'url': _static_url('dashboard:home')},
             {'label': _('Employees'), 'url': None},
         ]
 
     def get_queryset(self):
         """Apply filters and optimize query."""
-        queryset = super().get_queryset()
-        queryset = queryset.select_related(
-            'user',
-            'department',
-            'position',
-            'location'
+        queryset = self.get_filtered_queryset()
+        # English: Value dicts of only what the table rows read - no model instances
+        queryset = queryset.values(
+            *self.EMPLOYEE_TABLE_FIELDS, **self.EMPLOYEE_TABLE_ANNOTATIONS
         )
         return queryset.order_by('user__first_name', 'user__last_name')
 
@@ -65,74 +238,82 @@ class EmployeeListView(EmployeeTableMixin, FilterMixin, BreadcrumbMixin, LoginRe
         Compute statistics based on filtered queryset.
         English: Uses the filtered queryset passed as parameter.
         """
-        # Calculate stats on filtered queryset
-        total = queryset.count()
-        active = queryset.filter(is_active=True).count()
-        inactive = total - active
-
-        # Department count from filtered employees
-        dept_count = queryset.values('department').distinct().count()
+        # Calculate stats on filtered queryset in a single aggregate query
+        # (department is non-null, so the distinct count matches values().distinct())
+        counts = queryset.aggregate(
+            total=Count('pk'),
+            active=Count('pk', filter=Q(is_active=True)),
+            departments=Count('department', distinct=True),
+        )
+        inactive = counts['total'] - counts['active']
 
         return [
-            {'title': _('Total Employees'), 'value': total,
+            {'title': _('Total Employees'), 'value': counts['total'],
              'icon': 'people', 'bg_color': 'primary'},
-            {'title': _('Active'),          'value': active,
+            {'title': _('Active'),          'value': counts['active'],
              'icon': 'check_circle', 'bg_color': 'success'},
             {'title': _('Inactive'),        'value': inactive,
              'icon': 'cancel', 'bg_color': 'danger'},
-            {'title': _('Departments'),     'value': dept_count,
+            {'title': _('Departments'),     'value': counts['departments'],
              'icon': 'business', 'bg_color': 'info'},
         ]
 
+    @cached_property
+    def stats_cache_key(self):
+        """
+        Versioned cache key for the filtered stats.
+        English: Also keys the rendered stats fragment in the template.
+        """
+        params_hash = make_params_hash(self.request.GET, exclude=PAGINATION_PARAMS)
+        version = get_stats_version('employee_list')
+        return make_key('stats', 'employees', 'employee_list',
+                        f'v{version}', 'global', params_hash)
+
     def get_statistics(self, queryset):
         """Get statistics with caching based on filtered queryset."""
-        params_hash = make_params_hash(self.request.GET)
-        key = make_key('stats', 'employees', 'employee_list',
-                       'global', params_hash)
-        return get_or_set_stats(key, lambda: self._produce_stats(queryset))
+        return get_or_set_stats(self.stats_cache_key, lambda: self._produce_stats(queryset))
 
     def get_context_data(self, **kwargs):
         """Add statistics and context."""
-        # Get full filtered queryset BEFORE pagination for statistics
-        full_queryset = self.get_queryset()
+        # English: Stats aggregate over the filtered rows - no table joins/ordering
+        full_queryset = self.get_filtered_queryset()
 
         # Now call super() which will paginate the queryset
         context = super().get_context_data(**kwargs)
 
         # Statistics cards based on full filtered queryset (before pagination)
-        context['stats_cards'] = self.get_statistics(full_queryset)
+        # English: Lazy - a stats fragment cache hit in the template never evaluates
+        # it, so neither the stats cache lookup nor the aggregate runs
+        context['stats_cards'] = SimpleLazyObject(lambda: self.get_statistics(full_queryset))
+        context['stats_cache_key'] = self.stats_cache_key
+        context['stats_cache_ttl'] = get_stats_ttl()
 
         # English: Use mixin for table configuration
         context['table_columns'] = self.get_employee_table_columns()
         context['table_rows'] = self.prepare_employee_table_rows(context['employees'])
 
         # Empty state configuration - different for filtered vs unfiltered
-        if context.get('has_active_filters'):
-            # Filters are active - show "clear filters" message
-            context['empty_state_config'] = {
-                'icon': 'filter_alt_off',
-                'title': _('No employees match your filters'),
-                'message': _('Try adjusting or clearing your filters to see more results'),
-                'button_text': _('Clear Filters'),
-                'button_url': context.get('action_url', reverse('employees:employee_list'))
-            }
-        else:
-            # No filters - show "add first" message
-            context['empty_state_config'] = {
-                'icon': 'people_outline',
-                'title': _('No employees found'),
-                'message': _('Start by adding your first employee'),
-                'button_text': _('Add First Employee'),
-                'button_url': reverse('employees:employee_create')
-            }
+        # English: data_table only renders it without rows
+        if not context['table_rows']:
+            if context.get('has_active_filters'):
+                # Filters are active - show "clear filters" message
+                context['empty_state_config'] = dict(
+                    self._EMPTY_STATE_FILTERED,
+                    button_url=context.get('action_url', _static_url('employees:employee_list')),
+                )
+            else:
+                # No filters - show "add first" message
+                context['empty_state_config'] = dict(
+                    self._EMPTY_STATE_NEW, button_url=_static_url('employees:employee_create')
+                )
 
         context['employees_create_url'] = reverse_lazy('employees:employee_create')
 
         # English: Page header data
         context['page_title'] = _('Employees')
         context['page_subtitle'] = _('Manage employee records and information')
-        context['create_url'] = reverse('employees:employee_create')
-        context['back_url'] = reverse('dashboard:home')
+        context['create_url'] = _static_url('employees:employee_create')
+        context['back_url'] = _static_url('dashboard:home')
 
         # English: Header actions
         context['header_actions'] = [
@@ -298,8 +479,9 @@ class EmployeeFormMixin:
     def forms_invalid(self, form, user_form):
         """Handle invalid forms."""
         messages.error(self.request, _('Please correct the errors below.'))
-        context = self.get_context_data(form=form)
-        context['user_form'] = user_form
+        # English: Pass the validated user form through so the sections bind to it
+        # instead of a second user form built (and re-validated) from POST
+        context = self.get_context_data(form=form, user_form=user_form)
         return self.render_to_response(context)
 
     def get_success_url(self):
@@ -317,9 +499,8 @@ class EmployeeCreateView(EmployeeFormMixin, BreadcrumbMixin, LoginRequiredMixin,
     def get_breadcrumbs(self):
         """Static breadcrumbs for create view."""
         return [
-            {'label': _('Dashboard'), 'url': reverse('dashboard:home')},
-            {'label': _('Employees'), 'url': reverse(
-                'employees:employee_list')},
+            {'label': _('Dashboard'), 'url': _static_url('dashboard:home')},
+            {'label': _('Employees'), 'url': _static_url('employees:employee_list')},
             {'label': _('Create'), 'url': None},
         ]
 
@@ -337,27 +518,61 @@ class EmployeeCreateView(EmployeeFormMixin, BreadcrumbMixin, LoginRequiredMixin,
         """Create user and employee."""
         try:
             with transaction.atomic():
-                # English: Create user account
+                # English: Create user account. The random password is never shown -
+                # the employee sets their own through the emailed reset link
                 user = user_form.save(commit=False)
                 user.username = user.email
-                user.set_password('Password123!')
+                user.set_password(get_random_string(32))
                 user.save()
 
                 # English: Create employee
                 employee = form.save(commit=False)
                 employee.user = user
                 employee.save()
-
-                messages.success(
-                    self.request,
-                    _(f'Employee {employee.full_name} created successfully. Default password: Password123!')
-                )
-                return redirect('employees:employee_detail', pk=employee.pk)
         except Exception as e:
-            messages.error(self.request, _(
-                f'Error creating employee: {str(e)}'))
+            messages.error(
+                self.request,
+                _('Error creating employee: %(error)s') % {'error': e}
+            )
             return self.forms_invalid(form, user_form)
 
+        if self.send_password_setup_email(user):
+            messages.success(
+                self.request,
+                _('Employee %(name)s created successfully. A link to set a password has been sent to %(email)s.') % {
+                    'name': employee.full_name, 'email': user.email}
+            )
+        else:
+            messages.warning(
+                self.request,
+                _('Employee %(name)s created, but the password setup email could not be sent. '
+                  'The employee can use "Forgot password" on the login page.') % {
+                    'name': employee.full_name}
+            )
+        return redirect('employees:employee_detail', pk=employee.pk)
+
+    def send_password_setup_email(self, user):
+        """
+        Email the new user a link to set their own password.
+        English: Reuses the forgot-password flow (form, token, templates and
+        confirm view). Returns False if the email could not be sent.
+        """
+        reset_form = ForgotPasswordForm({'email': user.email})
+        if not reset_form.is_valid():
+            return False
+        try:
+            reset_form.save(
+                request=self.request,
+                use_https=self.request.is_secure(),
+                email_template_name='emails/password_reset.html',
+                subject_template_name='emails/password_reset_subject.txt',
+            )
+        except Exception:
+            logger = logging.getLogger(__name__)
+            logger.exception("Failed to send password setup email to user %s", user.pk)
+            return False
+        return True
+
 
 class EmployeeUpdateView(EmployeeFormMixin, BreadcrumbMixin, LoginRequiredMixin, UpdateView):
     """Update existing employee."""
@@ -365,14 +580,17 @@ class EmployeeUpdateView(EmployeeFormMixin, BreadcrumbMixin, LoginRequiredMixin,
     def get_breadcrumbs(self):
         """Dynamic breadcrumbs with employee name."""
         return [
-            {'label': _('Dashboard'), 'url': reverse('dashboard:home')},
-            {'label': _('Employees'), 'url': reverse(
-                'employees:employee_list')},
+            {'label': _('Dashboard'), 'url': _static_url('dashboard:home')},
+            {'label': _('Employees'), 'url': _static_url('employees:employee_list')},
             {'label': self.object.full_name, 'url': reverse(
                 'employees:employee_detail', kwargs={'pk': self.object.pk})},
             {'label': _('Edit'), 'url': None},
         ]
 
+    def get_queryset(self):
+        """Join the user - the user form is bound to it on GET and POST."""
+        return super().get_queryset().select_related('user')
+
     def get_user_form_instance(self):
         """Return existing user instance for update."""
         return self.object.user
@@ -401,12 +619,46 @@ class EmployeeDetailView(BreadcrumbMixin, LoginRequiredMixin, DetailView):
     template_name = 'employees/employee_detail.html'
     context_object_name = 'employee'
 
+    # English: Static header button parts; only the href varies per employee
+    _ACTION_UPLOAD = {'label': _('Upload Document'), 'icon': 'upload_file', 'style': 'primary'}
+    _ACTION_EDIT = {'label': _('Edit'), 'icon': 'edit', 'style': 'secondary'}
+    _ACTION_DELETE = {'label': _('Delete'), 'icon': 'delete', 'style': 'danger'}
+
+    # English: Static documents table parts; rows copy the actions with a per-row 'url'
+    _DOCUMENT_COLUMNS = (
+        {'title': _('Title')},
+        {'title': _('Type')},
+        {'title': _('Uploaded')},
+        {'title': _('Actions'), 'align': 'end'},
+    )
+    _DOCUMENT_PREVIEW_ACTION = {
+        'type': 'link', 'icon': 'visibility', 'color': 'primary',
+        'title': _('Preview'), 'target': '_blank',
+    }
+    _DOCUMENT_DELETE_ACTION = {'type': 'link', 'icon': 'delete', 'color': 'danger', 'title': _('Delete')}
+
+    def get_active_tab(self):
+        """English: Tab requested via ?tab=, personal by default."""
+        return self.request.GET.get('tab', 'personal')
+
+    def get_queryset(self):
+        """
+        Optimize query.
+        English: Relations shown on every tab are joined and the tab badge count is
+        a subquery; document rows are only prefetched for the documents tab.
+        """
+        queryset = super().get_queryset().select_related(
+            'user', 'department', 'position', 'location'
+        ).annotate(documents_count=_employee_count(EmployeeDocument.objects.all()))
+        if self.get_active_tab() == 'documents':
+            queryset = queryset.prefetch_related('documents')
+        return queryset
+
     def get_breadcrumbs(self):
         """Breadcrumbs for employee detail."""
         return [
-            {'label': _('Dashboard'), 'url': reverse('dashboard:home')},
-            {'label': _('Employees'), 'url': reverse(
-                'employees:employee_list')},
+            {'label': _('Dashboard'), 'url': _static_url('dashboard:home')},
+            {'label': _('Employees'), 'url': _static_url('employees:employee_list')},
             {'label': self.object.full_name, 'url': None},
         ]
 
@@ -418,25 +670,11 @@ class EmployeeDetailView(BreadcrumbMixin, LoginRequiredMixin, DetailView):
         Returns:
             list: Action buttons for header
         """
+        pk_kwargs = {'pk': self.object.pk}
         return [
-            {
-                'label': _('Upload Document'),
-                'icon': 'upload_file',
-                'href': reverse('employees:document_upload', kwargs={'pk': self.object.pk}),
-                'style': 'primary'
-            },
-            {
-                'label': _('Edit'),
-                'icon': 'edit',
-                'href': reverse('employees:employee_update', kwargs={'pk': self.object.pk}),
-                'style': 'secondary'
-            },
-            {
-                'label': _('Delete'),
-                'icon': 'delete',
-                'href': reverse('employees:employee_delete', kwargs={'pk': self.object.pk}),
-                'style': 'danger'
-            }
+            dict(self._ACTION_UPLOAD, href=reverse('employees:document_upload', kwargs=pk_kwargs)),
+            dict(self._ACTION_EDIT, href=reverse('employees:employee_update', kwargs=pk_kwargs)),
+            dict(self._ACTION_DELETE, href=reverse('employees:employee_delete', kwargs=pk_kwargs)),
         ]
 
     def get_tabs_config(self, documents_count):
@@ -590,22 +828,21 @@ class EmployeeDetailView(BreadcrumbMixin, LoginRequiredMixin, DetailView):
         English: Convert documents queryset to table rows format.
 
         Args:
-            documents: QuerySet of EmployeeDocument objects
+            documents: list of EmployeeDocument objects
 
         Returns:
             dict: Table columns and rows configuration
         """
-        if not documents.exists():
+        if not documents:
             return None
 
         employee = self.object
 
-        columns = [
-            {'title': _('Title')},
-            {'title': _('Type')},
-            {'title': _('Uploaded')},
-            {'title': _('Actions'), 'align': 'end'},
-        ]
+        columns = list(self._DOCUMENT_COLUMNS)
+
+        # English: Per-table URL templates - the employee pk is fixed, only doc_pk varies
+        edit_url = pk_url_template('employees:document_edit', 'doc_pk', pk=employee.pk)
+        delete_url = pk_url_template('employees:document_delete', 'doc_pk', pk=employee.pk)
 
         rows = []
         for doc in documents:
@@ -614,38 +851,11 @@ class EmployeeDetailView(BreadcrumbMixin, LoginRequiredMixin, DetailView):
 
             # Add preview action only if file exists
             if doc.file:
-                actions.append({
-                    'type': 'link',
-                    'url': doc.file.url,
-                    'icon': 'visibility',
-                    'color': 'primary',
-                    'title': _('Preview'),
-                    'target': '_blank'
-                })
+                actions.append(dict(self._DOCUMENT_PREVIEW_ACTION, url=doc.file.url))
 
-            # Always include edit action
-            actions.append({
-                'type': 'link',
-                'url': reverse(
-                    'employees:document_edit',
-                    kwargs={'pk': employee.pk, 'doc_pk': doc.pk}
-                ),
-                'icon': 'edit',
-                'color': 'secondary',
-                'title': _('Edit')
-            })
-
-            # Always include delete action
-            actions.append({
-                'type': 'link',
-                'url': reverse(
-                    'employees:document_delete',
-                    kwargs={'pk': employee.pk, 'doc_pk': doc.pk}
-                ),
-                'icon': 'delete',
-                'color': 'danger',
-                'title': _('Delete')
-            })
+            # Always include edit and delete actions
+            actions.append(dict(EDIT_ACTION, url=edit_url.format(doc.pk)))
+            actions.append(dict(self._DOCUMENT_DELETE_ACTION, url=delete_url.format(doc.pk)))
 
             rows.append({
                 'id': doc.pk,
@@ -653,7 +863,7 @@ class EmployeeDetailView(BreadcrumbMixin, LoginRequiredMixin, DetailView):
                     {'type': 'text', 'value': doc.title},
                     {
                         'type': 'badge',
-                        'text': doc.get_document_type_display(),
+                        'text': _DOCUMENT_TYPE_NAMES.get(doc.document_type, doc.document_type),
                         'color': 'info'
                     },
                     {'type': 'text', 'value': doc.created_at.strftime('%Y-%m-%d')},
@@ -669,20 +879,17 @@ class EmployeeDetailView(BreadcrumbMixin, LoginRequiredMixin, DetailView):
         employee = self.object
 
         # English: Determine active tab from query params
-        active_tab = self.request.GET.get('tab', 'personal')
+        active_tab = self.get_active_tab()
         context['active_tab'] = active_tab
 
         # English: Page header data
         context['page_title'] = employee.full_name
         context['page_subtitle'] = f"{employee.position.title} • {employee.department.name}"
-        context['back_url'] = reverse('employees:employee_list')
+        context['back_url'] = _static_url('employees:employee_list')
         context['header_actions'] = self.get_header_actions()
 
-        # English: Get documents for all tabs (needed for badge count)
-        documents = employee.documents.all()
-
-        # English: Tabs configuration
-        context['tabs'] = self.get_tabs_config(documents.count())
+        # English: Tabs configuration (badge count annotated in get_queryset)
+        context['tabs'] = self.get_tabs_config(employee.documents_count)
 
         # English: SIDEBAR BLOCKS - Employee profile card
         status_badge = {
@@ -806,7 +1013,8 @@ class EmployeeDetailView(BreadcrumbMixin, LoginRequiredMixin, DetailView):
 
         # Documents tab
         elif active_tab == 'documents':
-            documents_table = self.prepare_documents_table(documents)
+            # English: Prefetched in get_queryset for this tab only
+            documents_table = self.prepare_documents_table(list(employee.documents.all()))
             if documents_table:
                 content_blocks.append({
                     'type': 'table',
@@ -829,24 +1037,64 @@ class EmployeeDetailView(BreadcrumbMixin, LoginRequiredMixin, DetailView):
         return context
 
 
-class EmployeeDeleteView(BreadcrumbMixin, LoginRequiredMixin, DeleteView):
+class EmployeeDeleteView(BreadcrumbMixin, LoginRequiredMixin, PermissionRequiredMixin, ReuseObjectMixin, DeleteView):
     """Delete employee with validation and proper error handling."""
 
     model = Employee
     template_name = 'employees/employee_confirm_delete.html'
     success_url = reverse_lazy('employees:employee_list')
+    permission_required = 'employees.delete_employee'
+
+    # English: What gets removed along with the employee (lazy, translated per request)
+    _WARNING_ITEMS = (
+        _('Employee profile and employment history'),
+        _('Associated user account'),
+        _('All uploaded documents'),
+        _('Time clock records (if any)'),
+        _('Schedule history'),
+    )
+
+    # English: Blocking reference types in display order with their messages
+    _BLOCKING_MESSAGES = (
+        ('future_shifts', _('%(count)d future shift(s) scheduled')),
+        ('open_timeclock', _('%(count)d open timeclock entry(ies)')),
+        ('documents', _('%(count)d uploaded document(s)')),
+    )
 
     def get_breadcrumbs(self):
         """Breadcrumbs for employee delete."""
         return [
-            {'label': _('Dashboard'), 'url': reverse('dashboard:home')},
-            {'label': _('Employees'), 'url': reverse(
-                'employees:employee_list')},
+            {'label': _('Dashboard'), 'url': _static_url('dashboard:home')},
+            {'label': _('Employees'), 'url': _static_url('employees:employee_list')},
             {'label': self.object.full_name, 'url': reverse(
                 'employees:employee_detail', kwargs={'pk': self.object.pk})},
             {'label': _('Delete'), 'url': None},
         ]
 
+    def get_now(self):
+        """
+        English: Single reference time for this request, so every
+        time-relative check sees the same "now".
+        """
+        if not hasattr(self, '_now'):
+            self._now = timezone.now()
+        return self._now
+
+    def get_blocking_counters(self):
+        """Querysets of rows that block deletion, keyed by reference type."""
+        return _blocking_querysets(self.get_now())
+
+    def get_queryset(self):
+        """
+        Employee with its user and blocking counts in one query.
+        English: Counts are correlated subqueries with prefixed aliases
+        ('documents' would clash with the reverse relation).
+        """
+        return super().get_queryset().select_related('user').annotate(
+            **{f'n_{ref_type}': _employee_count(qs)
+               for ref_type, qs in self.get_blocking_counters().items()}
+        )
+
     def get_blocking_references(self):
         """
         Check for blocking references that prevent deletion.
@@ -856,59 +1104,30 @@ class EmployeeDeleteView(BreadcrumbMixin, LoginRequiredMixin, DeleteView):
         Returns:
             list: Blocking references or empty list if safe to delete
         """
+        # English: Memoized - post() and get_context_data() share one result
+        if hasattr(self, '_blocking_refs'):
+            return self._blocking_refs
+
         employee = self.object
-        blocking = []
 
-        # English: Check for active shifts (if schedules app exists)
-        if apps.is_installed('apps.schedules'):
-            try:
-                Shift = apps.get_model('schedules', 'Shift')
-                from django.utils import timezone
-
-                future_shifts = Shift.objects.filter(
-                    employee=employee,
-                    start_datetime__gte=timezone.now()
-                ).count()
-
-                if future_shifts > 0:
-                    blocking.append({
-                        'type': 'future_shifts',
-                        'count': future_shifts,
-                        'message': _('%(count)d future shift(s) scheduled') % {'count': future_shifts}
-                    })
-            except LookupError:
-                # English: Model doesn't exist yet
-                pass
-
-        # English: Check for timeclock records (if timeclock app exists)
-        if apps.is_installed('apps.timeclock'):
-            try:
-                TimeEntry = apps.get_model('timeclock', 'TimeEntry')
-
-                open_entries = TimeEntry.objects.filter(
-                    employee=employee,
-                    clock_out__isnull=True
-                ).count()
-
-                if open_entries > 0:
-                    blocking.append({
-                        'type': 'open_timeclock',
-                        'count': open_entries,
-                        'message': _('%(count)d open timeclock entry(ies)') % {'count': open_entries}
-                    })
-            except LookupError:
-                # English: Model doesn't exist yet
-                pass
-
-        # English: Check for uploaded documents (always available)
-        document_count = employee.documents.count()
-        if document_count > 0:
-            blocking.append({
-                'type': 'documents',
-                'count': document_count,
-                'message': _('%(count)d uploaded document(s)') % {'count': document_count}
-            })
+        # English: Counts arrive with the object fetch (see get_queryset); a missing
+        # alias means the relation's app isn't installed
+        counts = {
+            ref_type: getattr(employee, f'n_{ref_type}', 0)
+            for ref_type, message in self._BLOCKING_MESSAGES
+        }
+
+        blocking = [
+            {
+                'type': ref_type,
+                'count': counts[ref_type],
+                'message': message % {'count': counts[ref_type]}
+            }
+            for ref_type, message in self._BLOCKING_MESSAGES
+            if counts.get(ref_type)
+        ]
 
+        self._blocking_refs = blocking
         return blocking
 
     def get_warning_items(self):
@@ -917,15 +1136,9 @@ class EmployeeDeleteView(BreadcrumbMixin, LoginRequiredMixin, DeleteView):
         English: Information about what will be permanently deleted.
 
         Returns:
-            list: Warning items for display
+            tuple: Warning items for display
         """
-        return [
-            _('Employee profile and employment history'),
-            _('Associated user account'),
-            _('All uploaded documents'),
-            _('Time clock records (if any)'),
-            _('Schedule history'),
-        ]
+        return self._WARNING_ITEMS
 
     def get_context_data(self, **kwargs):
         """Add delete confirmation context."""
@@ -960,6 +1173,7 @@ class EmployeeDeleteView(BreadcrumbMixin, LoginRequiredMixin, DeleteView):
 
         return context
 
+    @transaction.atomic
     def post(self, request, *args, **kwargs):
         """Handle POST with validation."""
         self.object = self.get_object()
@@ -969,9 +1183,11 @@ class EmployeeDeleteView(BreadcrumbMixin, LoginRequiredMixin, DeleteView):
 
         if blocking_refs:
             # English: Build error message
-            messages_list = [ref['message'] for ref in blocking_refs]
-            error_msg = _('Cannot delete employee: ') + \
-                '; '.join(messages_list)
+            error_msg = format_lazy(
+                '{prefix}{items}',
+                prefix=_('Cannot delete employee: '),
+                items='; '.join(ref['message'] for ref in blocking_refs),
+            )
             messages.error(request, error_msg)
             return redirect('employees:employee_detail', pk=self.object.pk)
 
@@ -980,63 +1196,197 @@ class EmployeeDeleteView(BreadcrumbMixin, LoginRequiredMixin, DeleteView):
 
     def form_valid(self, form):
         """Handle successful deletion."""
+        # English: user is joined by get_queryset - no extra SELECT for the name
         employee_name = self.object.full_name
 
-        # English: Delete user account along with employee
-        user = self.object.user
-
         messages.success(
             self.request,
             _('Employee "%(name)s" has been deleted successfully.') % {
                 'name': employee_name}
         )
 
-        # English: Delete employee (cascade will handle documents)
-        response = super().form_valid(form)
-
-        # English: Delete associated user account
-        if user:
-            user.delete()
+        # English: Delete the user account - one cascade removes the employee
+        # profile and its documents too (inside post()'s transaction)
+        self.object.user.delete()
 
-        return response
+        return HttpResponseRedirect(self.get_success_url())
 
 # ============================================
-# Bulk Actions (временная заглушка)
+# Bulk Actions
 # ============================================
 
+# English: Max ids per IN (...) clause / transaction for bulk operations
+BULK_BATCH_SIZE = 1000
+# English: Largest accepted bulk payload - ~100k ids fit well below this
+BULK_MAX_BODY_BYTES = 1_000_000
+
+
+def _chunked(items, size):
+    """Yield successive lists of at most `size` items."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+# English: Bulk export columns as (header, values() key)
+BULK_EXPORT_COLUMNS = (
+    ('Employee ID', 'employee_id'),
+    ('First Name', 'user__first_name'),
+    ('Last Name', 'user__last_name'),
+    ('Email', 'user__email'),
+    ('Department', 'department__code'),
+    ('Position', 'position__code'),
+    ('Location', 'location__name'),
+    ('Employment Type', 'employment_type'),
+    ('Active', 'is_active'),
+)
+BULK_EXPORT_CHUNK_SIZE = 2000
+
+
+class _Echo:
+    """File-like object whose write() returns the value, for streaming csv.writer output."""
+
+    def write(self, value):
+        return value
+
+
+def _bulk_export_rows(ids):
+    """
+    Yield CSV lines for the selected employees.
+    English: One query ordered by employee_id across the whole selection, streamed
+    from a server-side cursor - no model instances and no full result set held
+    in memory.
+    """
+    writer = csv.writer(_Echo())
+    yield writer.writerow([header for header, _key in BULK_EXPORT_COLUMNS])
+    keys = [key for _header, key in BULK_EXPORT_COLUMNS]
+    rows = Employee.objects.filter(pk__in=ids).order_by('employee_id').values_list(*keys)
+    for row in rows.iterator(chunk_size=BULK_EXPORT_CHUNK_SIZE):
+        yield writer.writerow(row)
+
+
+def _get_bulk_delete_blocked_ids(ids, now):
+    """
+    Collect employee ids that cannot be deleted.
+    English: Same rules as EmployeeDeleteView (_blocking_querysets), but
+    resolved with one query per source for the whole batch instead of per employee.
+
+    Returns:
+        set: Employee ids with at least one blocking reference
+    """
+    blocked = set()
+    for queryset in _blocking_querysets(now).values():
+        blocked.update(queryset.filter(
+            employee_id__in=ids
+        ).values_list('employee_id', flat=True).distinct())
+    return blocked
+
 
 @require_POST
 @login_required
 def employee_bulk_action(request):
     """
     Handle bulk actions for employees.
-    TODO: Implement actual bulk operations
+    English: Every action works on id batches with set-based queries -
+    never a save()/delete() per employee.
     """
+    # English: Reject oversized payloads before the body is read into memory
+    try:
+        content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        content_length = 0
+    if content_length > BULK_MAX_BODY_BYTES:
+        return JsonResponse({'status': 'error', 'message': 'Payload too large'}, status=413)
+
+    # English: Without a Content-Length header (e.g. chunked transfer under ASGI)
+    # the check above passes, so check the size again once the body is read
+    body = request.body
+    if len(body) > BULK_MAX_BODY_BYTES:
+        return JsonResponse({'status': 'error', 'message': 'Payload too large'}, status=413)
+
+    # English: Parse and validate the payload once, reject malformed input early
     try:
-        data = json.loads(request.body)
-        action = data.get('action')
-        ids = data.get('ids', [])
+        data = json.loads(body)
+    except ValueError:
+        return JsonResponse({'status': 'error', 'message': 'Invalid JSON payload'}, status=400)
+
+    if not isinstance(data, dict):
+        return JsonResponse({'status': 'error', 'message': 'Invalid payload'}, status=400)
 
-        # Временная логика - просто возвращаем успех
-        # TODO: Реализовать действительные операции
+    action = data.get('action')
+    ids = data.get('ids', [])
+    if not isinstance(ids, list) or not all(isinstance(pk, int) and not isinstance(pk, bool) for pk in ids):
+        return JsonResponse({'status': 'error', 'message': 'ids must be a list of integers'}, status=400)
 
+    try:
         if action == 'export':
-            # Будет реализовано позже
-            return JsonResponse({'status': 'success', 'message': 'Export functionality coming soon'})
+            if not request.user.has_perm('employees.view_employee'):
+                return JsonResponse({'status': 'error', 'message': 'Permission denied'}, status=403)
+
+            response = StreamingHttpResponse(_bulk_export_rows(ids), content_type='text/csv')
+            response['Content-Disposition'] = 'attachment; filename="employees.csv"'
+            return response
 
         elif action == 'archive':
-            # Будет реализовано позже
-            return JsonResponse({'status': 'success', 'message': 'Archive functionality coming soon'})
+            if not request.user.has_perm('employees.change_employee'):
+                return JsonResponse({'status': 'error', 'message': 'Permission denied'}, status=403)
+
+            archived = 0
+            now = timezone.now()
+
+            # English: One UPDATE ... WHERE id IN (...) per batch. update() skips the
+            # post_save receiver, so the employee list stats version is bumped here.
+            for chunk in _chunked(ids, BULK_BATCH_SIZE):
+                with transaction.atomic():
+                    archived += Employee.objects.filter(
+                        pk__in=chunk, is_active=True
+                    ).update(is_active=False, updated_at=now)
+            if archived:
+                bump_stats_version('employee_list')
+
+            return JsonResponse({
+                'status': 'success',
+                'message': f'{archived} employee(s) archived',
+                'archived': archived,
+            })
 
         elif action == 'delete':
-            # Будет реализовано позже
-            return JsonResponse({'status': 'success', 'message': 'Bulk delete functionality coming soon'})
+            if not request.user.has_perm('employees.delete_employee'):
+                return JsonResponse({'status': 'error', 'message': 'Permission denied'}, status=403)
+
+            blocked = set()
+            deleted = 0
+            now = timezone.now()
+
+            # English: Per batch, the blocking check and one DELETE ... WHERE id IN (...)
+            # share a transaction. Deleting the user accounts cascades to the
+            # employee profiles, as in EmployeeDeleteView.
+            for chunk in _chunked(ids, BULK_BATCH_SIZE):
+                with transaction.atomic():
+                    chunk_blocked = _get_bulk_delete_blocked_ids(chunk, now)
+                    deletable = [pk for pk in chunk if pk not in chunk_blocked]
+                    if deletable:
+                        _, per_model = get_user_model().objects.filter(
+                            employee_profile__pk__in=deletable
+                        ).delete()
+                        deleted += per_model.get(Employee._meta.label, 0)
+                blocked |= chunk_blocked
+
+            return JsonResponse({
+                'status': 'success',
+                'message': f'{deleted} employee(s) deleted',
+                'deleted': deleted,
+                'blocked': sorted(blocked),
+            })
 
         else:
             return JsonResponse({'status': 'error', 'message': 'Unknown action'}, status=400)
 
-    except Exception as e:
-        return JsonResponse({'status': 'error', 'message': str(e)}, status=500)
+    except Exception:
+        # English: Keep database/internal error text out of the response
+        logger = logging.getLogger(__name__)
+        logger.exception("Bulk action %r failed", action)
+        return JsonResponse({'status': 'error', 'message': 'Bulk action failed'}, status=500)
 
 # ============================================
 # Department Views
@@ -1054,15 +1404,14 @@ class DepartmentListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permi
     def get_breadcrumbs(self):
         """Breadcrumbs for department list."""
         return [
-            {'label': _('Dashboard'), 'url': reverse('dashboard:home')},
-            {'label': _('Employees'), 'url': reverse(
-                'employees:employee_list')},
+            {'label': _('Dashboard'), 'url': _static_url('dashboard:home')},
+            {'label': _('Employees'), 'url': _static_url('employees:employee_list')},
             {'label': _('Departments'), 'url': None},
         ]
 
     def get_queryset(self):
         """Optimize query with annotations and relations."""
-        queryset = super().get_queryset()
+        queryset = self.get_filtered_queryset()
 
         # English: Add employee counts via annotation
         queryset = queryset.annotate(
@@ -1083,34 +1432,36 @@ class DepartmentListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permi
         Compute statistics based on filtered queryset.
         English: Uses the filtered queryset passed as parameter.
         """
-        # Calculate stats on filtered queryset
-        total = queryset.count()
-        active = queryset.filter(is_active=True).count()
-        inactive = total - active
-        with_manager = queryset.filter(manager__isnull=False).count()
+        # English: Single conditional aggregate instead of one COUNT per card
+        counts = queryset.aggregate(
+            total=Count('pk'),
+            active=Count('pk', filter=Q(is_active=True)),
+            inactive=Count('pk', filter=Q(is_active=False)),
+            with_manager=Count('pk', filter=Q(manager__isnull=False)),
+        )
 
         return [
             {
                 'title': _('Total Departments'),
-                'value': total,
+                'value': counts['total'],
                 'icon': 'business',
                 'bg_color': 'primary'
             },
             {
                 'title': _('Active'),
-                'value': active,
+                'value': counts['active'],
                 'icon': 'check_circle',
                 'bg_color': 'success'
             },
             {
                 'title': _('Inactive'),
-                'value': inactive,
+                'value': counts['inactive'],
                 'icon': 'cancel',
                 'bg_color': 'danger'
             },
             {
                 'title': _('With Manager'),
-                'value': with_manager,
+                'value': counts['with_manager'],
                 'icon': 'person',
                 'bg_color': 'info'
             },
@@ -1118,9 +1469,10 @@ class DepartmentListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permi
 
     def get_statistics(self, queryset):
         """Get statistics with caching based on filtered queryset."""
-        params_hash = make_params_hash(self.request.GET)
+        params_hash = make_params_hash(self.request.GET, exclude=PAGINATION_PARAMS)
+        version = get_stats_version('department_list')
         key = make_key('stats', 'employees', 'department_list',
-                       'global', params_hash)
+                       f'v{version}', 'global', params_hash)
         return get_or_set_stats(key, lambda: self._produce_stats(queryset))
 
     def prepare_table_rows(self, departments):
@@ -1129,15 +1481,18 @@ class DepartmentListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permi
         English: Convert QuerySet to structured dict with cells for templates.
         """
         table_rows = []
+        detail_url = pk_url_template('employees:department_detail')
+        edit_url = pk_url_template('employees:department_update')
 
         for dept in departments:
+            status_text, status_color = STATUS_BADGE[dept.is_active]
             table_rows.append({
                 'id': dept.id,
                 'cells': [
                     {
                         'type': 'badge',
-                        'text': _('Active') if dept.is_active else _('Inactive'),
-                        'color': 'success' if dept.is_active else 'secondary',
+                        'text': status_text,
+                        'color': status_color,
                         'subtitle': dept.code
                     },
                     {
@@ -1161,20 +1516,8 @@ class DepartmentListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permi
                     {
                         'type': 'actions',
                         'actions': [
-                            {
-                                'type': 'link',
-                                'url': dept.get_absolute_url(),
-                                'icon': 'visibility',
-                                'title': _('View'),
-                                'color': 'primary'
-                            },
-                            {
-                                'type': 'link',
-                                'url': dept.get_edit_url(),
-                                'icon': 'edit',
-                                'title': _('Edit'),
-                                'color': 'secondary'
-                            }
+                            dict(VIEW_ACTION, url=detail_url.format(dept.pk)),
+                            dict(EDIT_ACTION, url=edit_url.format(dept.pk)),
                         ]
                     }
                 ]
@@ -1184,8 +1527,8 @@ class DepartmentListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permi
 
     def get_context_data(self, **kwargs):
         """Add extra context for template."""
-        # Get full filtered queryset BEFORE pagination for statistics
-        full_queryset = self.get_queryset()
+        # English: Stats aggregate over the filtered rows - no employees JOIN/GROUP BY
+        full_queryset = self.get_filtered_queryset()
 
         # Now call super() which will paginate the queryset
         ctx = super().get_context_data(**kwargs)
@@ -1193,8 +1536,8 @@ class DepartmentListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permi
         # English: Page header data
         ctx['page_title'] = _('Departments')
         ctx['page_subtitle'] = _('Manage organizational departments')
-        ctx['create_url'] = reverse('employees:department_create')
-        ctx['back_url'] = reverse('employees:employee_list')
+        ctx['create_url'] = _static_url('employees:department_create')
+        ctx['back_url'] = _static_url('employees:employee_list')
 
         # English: Header actions
         ctx['header_actions'] = [
@@ -1231,7 +1574,7 @@ class DepartmentListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permi
                 'title': _('No departments match your filters'),
                 'message': _('Try adjusting or clearing your filters to see more results'),
                 'button_text': _('Clear Filters'),
-                'button_url': ctx.get('action_url', reverse('employees:department_list'))
+                'button_url': ctx.get('action_url', _static_url('employees:department_list'))
             }
         else:
             # No filters - show "add first" message
@@ -1258,9 +1601,9 @@ class DepartmentDetailView(EmployeeTableMixin, BreadcrumbMixin, LoginRequiredMix
     def get_breadcrumbs(self):
         """Breadcrumbs for department detail."""
         return [
-            {'label': _('Dashboard'), 'url': reverse('dashboard:home')},
-            {'label': _('Employees'), 'url': reverse('employees:employee_list')},
-            {'label': _('Departments'), 'url': reverse('employees:department_list')},
+            {'label': _('Dashboard'), 'url': _static_url('dashboard:home')},
+            {'label': _('Employees'), 'url': _static_url('employees:employee_list')},
+            {'label': _('Departments'), 'url': _static_url('employees:department_list')},
             {'label': self.object.name, 'url': None},
         ]
     
@@ -1297,25 +1640,25 @@ class DepartmentDetailView(EmployeeTableMixin, BreadcrumbMixin, LoginRequiredMix
         ctx['page_title'] = dept.name
         ctx['page_subtitle'] = _('Department Code: %(code)s') % {'code': dept.code}
         ctx['header_actions'] = self.get_header_actions()
-        ctx['back_url'] = reverse('employees:department_list')
+        ctx['back_url'] = _static_url('employees:department_list')
         
-        # English: Statistics cards
+        # English: Statistics cards (counts come from get_queryset annotations)
         ctx['stats_cards'] = [
             {
                 'title': _('Total Employees'),
-                'value': dept.employee_count,
+                'value': dept.total_employees,
                 'icon': 'people',
                 'bg_color': 'primary'
             },
             {
                 'title': _('Active Employees'),
-                'value': dept.active_employee_count,
+                'value': dept.active_employees,
                 'icon': 'check_circle',
                 'bg_color': 'success'
             },
             {
                 'title': _('Inactive Employees'),
-                'value': dept.inactive_employee_count,
+                'value': dept.total_employees - dept.active_employees,
                 'icon': 'cancel',
                 'bg_color': 'secondary'
             },
@@ -1353,13 +1696,8 @@ class DepartmentDetailView(EmployeeTableMixin, BreadcrumbMixin, LoginRequiredMix
             })
 
         sidebar_blocks.extend([
-            {'type': 'divider'},
-            # Basic Information section
-            {
-                'type': 'section_header',
-                'icon': 'info',
-                'title': _('Basic Information')
-            },
+            _SIDEBAR_DIVIDER,
+            _SIDEBAR_BASIC_INFO_HEADER,
         ])
 
         # Add description if present
@@ -1372,12 +1710,8 @@ class DepartmentDetailView(EmployeeTableMixin, BreadcrumbMixin, LoginRequiredMix
 
         # Management section
         sidebar_blocks.extend([
-            {'type': 'divider'},
-            {
-                'type': 'section_header',
-                'icon': 'person',
-                'title': _('Management')
-            },
+            _SIDEBAR_DIVIDER,
+            _SIDEBAR_MANAGEMENT_HEADER,
             {
                 'type': 'field',
                 'icon': 'person',
@@ -1407,9 +1741,7 @@ class DepartmentDetailView(EmployeeTableMixin, BreadcrumbMixin, LoginRequiredMix
         ctx['active_tab'] = self.request.GET.get('tab', 'employees')
 
         # English: Employees list (main content - right column)
-        employees = dept.employees.select_related(
-            'user', 'position', 'location'
-        ).order_by('user__first_name', 'user__last_name')
+        employees = self.get_employee_table_queryset().filter(department=dept)
 
         # English: Content blocks configuration (new component blocks system)
         content_blocks = [
@@ -1551,7 +1883,7 @@ class DepartmentFormMixin:
     def get_success_url(self):
         if getattr(self, 'object', None):
             return reverse('employees:department_detail', kwargs={'pk': self.object.pk})
-        return reverse('employees:department_list')
+        return _static_url('employees:department_list')
 
 
 # ============================================
@@ -1566,9 +1898,9 @@ class DepartmentCreateView(DepartmentFormMixin, BreadcrumbMixin, LoginRequiredMi
     def get_breadcrumbs(self):
         """Breadcrumbs for department create."""
         return [
-            {'label': _('Dashboard'), 'url': reverse('dashboard:home')},
-            {'label': _('Employees'), 'url': reverse('employees:employee_list')},
-            {'label': _('Departments'), 'url': reverse('employees:department_list')},
+            {'label': _('Dashboard'), 'url': _static_url('dashboard:home')},
+            {'label': _('Employees'), 'url': _static_url('employees:employee_list')},
+            {'label': _('Departments'), 'url': _static_url('employees:department_list')},
             {'label': _('Create'), 'url': None},
         ]
     
@@ -1591,9 +1923,9 @@ class DepartmentUpdateView(DepartmentFormMixin, BreadcrumbMixin, LoginRequiredMi
     def get_breadcrumbs(self):
         """Breadcrumbs for department update."""
         return [
-            {'label': _('Dashboard'), 'url': reverse('dashboard:home')},
-            {'label': _('Employees'), 'url': reverse('employees:employee_list')},
-            {'label': _('Departments'), 'url': reverse('employees:department_list')},
+            {'label': _('Dashboard'), 'url': _static_url('dashboard:home')},
+            {'label': _('Employees'), 'url': _static_url('employees:employee_list')},
+            {'label': _('Departments'), 'url': _static_url('employees:department_list')},
             {'label': self.object.name, 'url': reverse('employees:department_detail', kwargs={'pk': self.object.pk})},
             {'label': _('Edit'), 'url': None},
         ]
@@ -1624,23 +1956,38 @@ class DepartmentDeleteView(BreadcrumbMixin, LoginRequiredMixin, PermissionRequir
     def get_breadcrumbs(self):
         """Breadcrumbs for department delete."""
         return [
-            {'label': _('Dashboard'), 'url': reverse('dashboard:home')},
-            {'label': _('Employees'), 'url': reverse('employees:employee_list')},
-            {'label': _('Departments'), 'url': reverse('employees:department_list')},
+            {'label': _('Dashboard'), 'url': _static_url('dashboard:home')},
+            {'label': _('Employees'), 'url': _static_url('employees:employee_list')},
+            {'label': _('Departments'), 'url': _static_url('employees:department_list')},
             {'label': self.object.name, 'url': reverse('employees:department_detail', kwargs={'pk': self.object.pk})},
             {'label': _('Delete'), 'url': None},
         ]
     
+    def get_queryset(self):
+        """
+        English: Fetch the department with its active/total employee counts in the
+        same query, so the delete checks need no extra COUNT round-trips.
+        """
+        return super().get_queryset().annotate(
+            active_emp_count=Count('employees', filter=Q(employees__is_active=True)),
+            total_emp_count=Count('employees'),
+        )
+        
     def get_blocking_references(self):
         """
         Check for blocking references.
         English: Returns list of blocking issues preventing deletion.
         """
+        # English: Memoized - post() and get_context_data() share one result
+        if hasattr(self, '_blocking_refs'):
+            return self._blocking_refs
+        
         dept = self.object
         blocking = []
         
-        # English: Check for active employees
-        active_count = dept.employees.filter(is_active=True).count()
+        # English: Counts arrive with the object fetch (see get_queryset)
+        active_count = dept.active_emp_count
+        total_count = dept.total_emp_count
         if active_count > 0:
             blocking.append({
                 'type': 'active_employees',
@@ -1649,7 +1996,6 @@ class DepartmentDeleteView(BreadcrumbMixin, LoginRequiredMixin, PermissionRequir
             })
         
         # English: Check for any employees (active or inactive)
-        total_count = dept.employees.count()
         if total_count > 0 and active_count == 0:
             blocking.append({
                 'type': 'employees_history',
@@ -1657,6 +2003,7 @@ class DepartmentDeleteView(BreadcrumbMixin, LoginRequiredMixin, PermissionRequir
                 'message': _('%(count)d employee(s) in history') % {'count': total_count}
             })
         
+        self._blocking_refs = blocking
         return blocking
     
     def get_context_data(self, **kwargs):
@@ -1684,6 +2031,7 @@ class DepartmentDeleteView(BreadcrumbMixin, LoginRequiredMixin, PermissionRequir
         
         return ctx
     
+    @transaction.atomic
     def post(self, request, *args, **kwargs):
         """Handle POST with validation."""
         self.object = self.get_object()
@@ -1692,8 +2040,11 @@ class DepartmentDeleteView(BreadcrumbMixin, LoginRequiredMixin, PermissionRequir
         blocking_refs = self.get_blocking_references()
         
         if blocking_refs:
-            messages_list = [ref['message'] for ref in blocking_refs]
-            error_msg = _('Cannot delete department: ') + '; '.join(messages_list)
+            error_msg = format_lazy(
+                '{prefix}{items}',
+                prefix=_('Cannot delete department: '),
+                items='; '.join(ref['message'] for ref in blocking_refs),
+            )
             messages.error(request, error_msg)
             return redirect('employees:department_detail', pk=self.object.pk)
         
@@ -1726,14 +2077,14 @@ class PositionListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permiss
     def get_breadcrumbs(self):
         """Breadcrumbs for position list."""
         return [
-            {'label': _('Dashboard'), 'url': reverse('dashboard:home')},
-            {'label': _('Employees'), 'url': reverse('employees:employee_list')},
+            {'label': _('Dashboard'), 'url': _static_url('dashboard:home')},
+            {'label': _('Employees'), 'url': _static_url('employees:employee_list')},
             {'label': _('Positions'), 'url': None},
         ]
 
     def get_queryset(self):
         """Optimize query with annotations."""
-        queryset = super().get_queryset()
+        queryset = self.get_filtered_queryset()
 
         # English: Add employee counts via annotation
         queryset = queryset.annotate(
@@ -1742,6 +2093,11 @@ class PositionListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permiss
             inactive_employees=Count('employees', filter=Q(employees__is_active=False))
         )
 
+        # English: Table only shows a 50-char excerpt - truncate in SQL, skip full text
+        queryset = queryset.annotate(
+            description_short=Substr('description', 1, 51)
+        ).defer('description')
+
         return queryset.order_by('title')
 
     def _produce_stats(self, queryset):
@@ -1749,43 +2105,22 @@ class PositionListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permiss
         Compute statistics based on filtered queryset.
         English: Uses the filtered queryset passed as parameter.
         """
-        # Calculate stats on filtered queryset
-        total = queryset.count()
-        active = queryset.filter(is_active=True).count()
-        inactive = total - active
-        requires_cert = queryset.filter(requires_certification=True).count()
+        # Calculate stats on filtered queryset in a single aggregate query
+        counts = queryset.aggregate(
+            total=Count('pk'),
+            active=Count('pk', filter=Q(is_active=True)),
+            requires_cert=Count('pk', filter=Q(requires_certification=True)),
+        )
+        counts['inactive'] = counts['total'] - counts['active']
 
-        return [
-            {
-                'title': _('Total Positions'),
-                'value': total,
-                'icon': 'work',
-                'bg_color': 'primary'
-            },
-            {
-                'title': _('Active'),
-                'value': active,
-                'icon': 'check_circle',
-                'bg_color': 'success'
-            },
-            {
-                'title': _('Inactive'),
-                'value': inactive,
-                'icon': 'cancel',
-                'bg_color': 'danger'
-            },
-            {
-                'title': _('Requires Certification'),
-                'value': requires_cert,
-                'icon': 'verified',
-                'bg_color': 'info'
-            },
-        ]
+        return [dict(card, value=counts[key]) for key, card in _POSITION_STATS_CARDS]
 
     def get_statistics(self, queryset):
         """Get statistics with caching based on filtered queryset."""
-        params_hash = make_params_hash(self.request.GET)
-        key = make_key('stats', 'employees', 'position_list', 'global', params_hash)
+        params_hash = make_params_hash(self.request.GET, exclude=PAGINATION_PARAMS)
+        version = get_stats_version('position_list')
+        key = make_key('stats', 'employees', 'position_list',
+                       f'v{version}', 'global', params_hash)
         return get_or_set_stats(key, lambda: self._produce_stats(queryset))
 
     def prepare_table_rows(self, positions):
@@ -1794,23 +2129,30 @@ class PositionListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permiss
         English: Convert QuerySet to structured dict with cells for templates.
         """
         table_rows = []
+        detail_url = pk_url_template('employees:position_detail')
+        edit_url = pk_url_template('employees:position_update')
 
         for pos in positions:
+            status_text, status_color = STATUS_BADGE[pos.is_active]
+            cert_text, cert_color = _CERTIFICATION_BADGE[pos.requires_certification]
+            description = pos.description_short or ''
+            if len(description) > 50:
+                description = description[:50] + '...'
             table_rows.append({
                 'id': pos.id,
                 'cells': [
                     # Status badge with code as subtitle
                     {
                         'type': 'badge',
-                        'text': _('Active') if pos.is_active else _('Inactive'),
-                        'color': 'success' if pos.is_active else 'secondary',
+                        'text': status_text,
+                        'color': status_color,
                         'subtitle': pos.code
                     },
                     # Position title with description
                     {
                         'type': 'text',
                         'value': pos.title,
-                        'subtitle': pos.description[:50] + '...' if pos.description and len(pos.description) > 50 else pos.description or '',
+                        'subtitle': description,
                         'class': 'fw-bold'
                     },
                     # Hourly rate range
@@ -1821,8 +2163,8 @@ class PositionListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permiss
                     # Certification required badge
                     {
                         'type': 'badge',
-                        'text': _('Required') if pos.requires_certification else _('Not Required'),
-                        'color': 'warning' if pos.requires_certification else 'secondary'
+                        'text': cert_text,
+                        'color': cert_color
                     },
                     # Employee count (only active)
                     {
@@ -1834,20 +2176,8 @@ class PositionListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permiss
                     {
                         'type': 'actions',
                         'actions': [
-                            {
-                                'type': 'link',
-                                'url': pos.get_absolute_url(),
-                                'icon': 'visibility',
-                                'title': _('View'),
-                                'color': 'primary'
-                            },
-                            {
-                                'type': 'link',
-                                'url': pos.get_edit_url(),
-                                'icon': 'edit',
-                                'title': _('Edit'),
-                                'color': 'secondary'
-                            }
+                            dict(VIEW_ACTION, url=detail_url.format(pos.pk)),
+                            dict(EDIT_ACTION, url=edit_url.format(pos.pk)),
                         ]
                     }
                 ]
@@ -1857,17 +2187,16 @@ class PositionListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permiss
 
     def get_context_data(self, **kwargs):
         """Add extra context for template."""
-        # Get full filtered queryset BEFORE pagination for statistics
-        full_queryset = self.get_queryset()
+        # English: Stats aggregate over the filtered rows - no employees JOIN/GROUP BY
+        full_queryset = self.get_filtered_queryset()
 
-        # Now call super() which will paginate the queryset
         ctx = super().get_context_data(**kwargs)
 
         # English: Page header data
         ctx['page_title'] = _('Positions')
         ctx['page_subtitle'] = _('Manage job positions and roles')
-        ctx['create_url'] = reverse('employees:position_create')
-        ctx['back_url'] = reverse('employees:employee_list')
+        ctx['create_url'] = _static_url('employees:position_create')
+        ctx['back_url'] = _static_url('employees:employee_list')
 
         # English: Header actions
         ctx['header_actions'] = [
@@ -1903,7 +2232,7 @@ class PositionListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permiss
                 'title': _('No positions match your filters'),
                 'message': _('Try adjusting or clearing your filters to see more results'),
                 'button_text': _('Clear Filters'),
-                'button_url': ctx.get('action_url', reverse('employees:position_list'))
+                'button_url': ctx.get('action_url', _static_url('employees:position_list'))
             }
         else:
             # No filters - show "add first" message
@@ -1929,9 +2258,9 @@ class PositionDetailView(EmployeeTableMixin, BreadcrumbMixin, LoginRequiredMixin
     def get_breadcrumbs(self):
         """Breadcrumbs for position detail."""
         return [
-            {'label': _('Dashboard'), 'url': reverse('dashboard:home')},
-            {'label': _('Employees'), 'url': reverse('employees:employee_list')},
-            {'label': _('Positions'), 'url': reverse('employees:position_list')},
+            {'label': _('Dashboard'), 'url': _static_url('dashboard:home')},
+            {'label': _('Employees'), 'url': _static_url('employees:employee_list')},
+            {'label': _('Positions'), 'url': _static_url('employees:position_list')},
             {'label': self.object.title, 'url': None},
         ]
 
@@ -1956,7 +2285,8 @@ class PositionDetailView(EmployeeTableMixin, BreadcrumbMixin, LoginRequiredMixin
         """Optimize query."""
         return super().get_queryset().annotate(
             total_employees=Count('employees'),
-            active_employees=Count('employees', filter=Q(employees__is_active=True))
+            active_employees=Count('employees', filter=Q(employees__is_active=True)),
+            inactive_employees=Count('employees', filter=Q(employees__is_active=False))
         )
 
     def get_context_data(self, **kwargs):
@@ -1968,25 +2298,25 @@ class PositionDetailView(EmployeeTableMixin, BreadcrumbMixin, LoginRequiredMixin
         ctx['page_title'] = pos.title
         ctx['page_subtitle'] = _('Position Code: %(code)s') % {'code': pos.code}
         ctx['header_actions'] = self.get_header_actions()
-        ctx['back_url'] = reverse('employees:position_list')
+        ctx['back_url'] = _static_url('employees:position_list')
 
-        # English: Statistics cards
+        # English: Statistics cards (counts annotated in get_queryset)
         ctx['stats_cards'] = [
             {
                 'title': _('Total Employees'),
-                'value': pos.employee_count,
+                'value': pos.total_employees,
                 'icon': 'people',
                 'bg_color': 'primary'
             },
             {
                 'title': _('Active Employees'),
-                'value': pos.active_employee_count,
+                'value': pos.active_employees,
                 'icon': 'check_circle',
                 'bg_color': 'success'
             },
             {
                 'title': _('Inactive Employees'),
-                'value': pos.inactive_employee_count,
+                'value': pos.inactive_employees,
                 'icon': 'cancel',
                 'bg_color': 'secondary'
             },
@@ -2024,13 +2354,8 @@ class PositionDetailView(EmployeeTableMixin, BreadcrumbMixin, LoginRequiredMixin
             })
 
         sidebar_blocks.extend([
-            {'type': 'divider'},
-            # Basic Information section
-            {
-                'type': 'section_header',
-                'icon': 'info',
-                'title': _('Basic Information')
-            },
+            _SIDEBAR_DIVIDER,
+            _SIDEBAR_BASIC_INFO_HEADER,
         ])
 
         # Add description if present
@@ -2043,12 +2368,8 @@ class PositionDetailView(EmployeeTableMixin, BreadcrumbMixin, LoginRequiredMixin
 
         # Compensation section
         sidebar_blocks.extend([
-            {'type': 'divider'},
-            {
-                'type': 'section_header',
-                'icon': 'payments',
-                'title': _('Compensation')
-            },
+            _SIDEBAR_DIVIDER,
+            _SIDEBAR_COMPENSATION_HEADER,
             {
                 'type': 'field',
                 'icon': 'attach_money',
@@ -2071,12 +2392,8 @@ class PositionDetailView(EmployeeTableMixin, BreadcrumbMixin, LoginRequiredMixin
 
         # Requirements section
         sidebar_blocks.extend([
-            {'type': 'divider'},
-            {
-                'type': 'section_header',
-                'icon': 'verified',
-                'title': _('Requirements')
-            },
+            _SIDEBAR_DIVIDER,
+            _SIDEBAR_REQUIREMENTS_HEADER,
             {
                 'type': 'field',
                 'icon': 'verified_user',
@@ -2100,9 +2417,7 @@ class PositionDetailView(EmployeeTableMixin, BreadcrumbMixin, LoginRequiredMixin
         ctx['active_tab'] = self.request.GET.get('tab', 'employees')
 
         # English: Employees list (main content - right column)
-        employees = pos.employees.select_related(
-            'user', 'department', 'location'
-        ).order_by('user__first_name', 'user__last_name')
+        employees = self.get_employee_table_queryset().filter(position=pos)
 
         # English: Content blocks configuration (new component blocks system)
         ctx['content_blocks'] = [
@@ -2195,7 +2510,7 @@ class PositionFormMixin:
     def get_success_url(self):
         if getattr(self, 'object', None):
             return reverse('employees:position_detail', kwargs={'pk': self.object.pk})
-        return reverse('employees:position_list')
+        return _static_url('employees:position_list')
 
 
 # ============================================
@@ -2210,9 +2525,9 @@ class PositionCreateView(PositionFormMixin, BreadcrumbMixin, LoginRequiredMixin,
     def get_breadcrumbs(self):
         """Breadcrumbs for position create."""
         return [
-            {'label': _('Dashboard'), 'url': reverse('dashboard:home')},
-            {'label': _('Employees'), 'url': reverse('employees:employee_list')},
-            {'label': _('Positions'), 'url': reverse('employees:position_list')},
+            {'label': _('Dashboard'), 'url': _static_url('dashboard:home')},
+            {'label': _('Employees'), 'url': _static_url('employees:employee_list')},
+            {'label': _('Positions'), 'url': _static_url('employees:position_list')},
             {'label': _('Create'), 'url': None},
         ]
 
@@ -2235,9 +2550,9 @@ class PositionUpdateView(PositionFormMixin, BreadcrumbMixin, LoginRequiredMixin,
     def get_breadcrumbs(self):
         """Breadcrumbs for position update."""
         return [
-            {'label': _('Dashboard'), 'url': reverse('dashboard:home')},
-            {'label': _('Employees'), 'url': reverse('employees:employee_list')},
-            {'label': _('Positions'), 'url': reverse('employees:position_list')},
+            {'label': _('Dashboard'), 'url': _static_url('dashboard:home')},
+            {'label': _('Employees'), 'url': _static_url('employees:employee_list')},
+            {'label': _('Positions'), 'url': _static_url('employees:position_list')},
             {'label': self.object.title, 'url': reverse('employees:position_detail', kwargs={'pk': self.object.pk})},
             {'label': _('Edit'), 'url': None},
         ]
@@ -2268,23 +2583,38 @@ class PositionDeleteView(BreadcrumbMixin, LoginRequiredMixin, PermissionRequired
     def get_breadcrumbs(self):
         """Breadcrumbs for position delete."""
         return [
-            {'label': _('Dashboard'), 'url': reverse('dashboard:home')},
-            {'label': _('Employees'), 'url': reverse('employees:employee_list')},
-            {'label': _('Positions'), 'url': reverse('employees:position_list')},
+            {'label': _('Dashboard'), 'url': _static_url('dashboard:home')},
+            {'label': _('Employees'), 'url': _static_url('employees:employee_list')},
+            {'label': _('Positions'), 'url': _static_url('employees:position_list')},
             {'label': self.object.title, 'url': reverse('employees:position_detail', kwargs={'pk': self.object.pk})},
             {'label': _('Delete'), 'url': None},
         ]
 
+    def get_queryset(self):
+        """
+        English: Fetch the position with its active/total employee counts in the
+        same query, so the delete checks need no extra COUNT round-trips.
+        """
+        return super().get_queryset().annotate(
+            active_emp_count=Count('employees', filter=Q(employees__is_active=True)),
+            total_emp_count=Count('employees'),
+        )
+
     def get_blocking_references(self):
         """
         Check for blocking references.
         English: Returns list of blocking issues preventing deletion.
         """
+        # English: Memoized - post() and get_context_data() share one result
+        if hasattr(self, '_blocking_refs'):
+            return self._blocking_refs
+
         pos = self.object
         blocking = []
 
-        # English: Check for active employees
-        active_count = pos.employees.filter(is_active=True).count()
+        # English: Counts arrive with the object fetch (see get_queryset)
+        active_count = pos.active_emp_count
+        total_count = pos.total_emp_count
         if active_count > 0:
             blocking.append({
                 'type': 'active_employees',
@@ -2293,7 +2623,6 @@ class PositionDeleteView(BreadcrumbMixin, LoginRequiredMixin, PermissionRequired
             })
 
         # English: Check for any employees (active or inactive)
-        total_count = pos.employees.count()
         if total_count > 0 and active_count == 0:
             blocking.append({
                 'type': 'employees_history',
@@ -2301,6 +2630,7 @@ class PositionDeleteView(BreadcrumbMixin, LoginRequiredMixin, PermissionRequired
                 'message': _('%(count)d employee(s) in history') % {'count': total_count}
             })
 
+        self._blocking_refs = blocking
         return blocking
 
     def get_context_data(self, **kwargs):
@@ -2328,6 +2658,7 @@ class PositionDeleteView(BreadcrumbMixin, LoginRequiredMixin, PermissionRequired
 
         return ctx
 
+    @transaction.atomic
     def post(self, request, *args, **kwargs):
         """Handle POST with validation."""
         self.object = self.get_object()
@@ -2336,8 +2667,11 @@ class PositionDeleteView(BreadcrumbMixin, LoginRequiredMixin, PermissionRequired
         blocking_refs = self.get_blocking_references()
 
         if blocking_refs:
-            messages_list = [ref['message'] for ref in blocking_refs]
-            error_msg = _('Cannot delete position: ') + '; '.join(messages_list)
+            error_msg = format_lazy(
+                '{prefix}{items}',
+                prefix=_('Cannot delete position: '),
+                items='; '.join(ref['message'] for ref in blocking_refs),
+            )
             messages.error(request, error_msg)
             return redirect('employees:position_detail', pk=self.object.pk)
 
@@ -2361,7 +2695,13 @@ class PositionDeleteView(BreadcrumbMixin, LoginRequiredMixin, PermissionRequired
 @login_required
 def employee_document_upload(request, pk):
     """Upload document for employee."""
-    employee = get_object_or_404(Employee, pk=pk)
+    # English: Only the name columns are needed (page title)
+    employee = get_object_or_404(
+        Employee.objects.select_related('user').only(
+            'id', 'user__first_name', 'user__last_name', 'user__email'
+        ),
+        pk=pk
+    )
 
     if request.method == 'POST':
         form = EmployeeDocumentForm(request.POST, request.FILES)
@@ -2392,7 +2732,8 @@ def employee_document_upload(request, pk):
 @login_required
 def employee_document_edit(request, pk, doc_pk):
     """Edit employee document."""
-    employee = get_object_or_404(Employee, pk=pk)
+    # English: Employee is only used for scoping and redirect URLs
+    employee = get_object_or_404(Employee.objects.only('id'), pk=pk)
     document = get_object_or_404(EmployeeDocument, pk=doc_pk, employee=employee)
 
     if request.method == 'POST':
@@ -2440,27 +2781,37 @@ def employee_document_edit(request, pk, doc_pk):
 @login_required
 def employee_document_delete(request, pk, doc_pk):
     """Delete employee document."""
-    employee = get_object_or_404(Employee, pk=pk)
+    # English: Scoped by employee_id - the employee row itself isn't needed to delete
+    documents = EmployeeDocument.objects.filter(pk=doc_pk, employee_id=pk)
+    documents_url = reverse('employees:employee_detail', kwargs={
+                            'pk': pk}) + '?tab=documents'
+
+    if request.method == 'POST':
+        # English: Single DELETE - zero rows means it was already deleted
+        deleted = documents.delete()[0]
+        if deleted:
+            messages.success(request, _('Document deleted successfully.'))
+        else:
+            # English: Unknown employee is still a 404, as on GET
+            get_object_or_404(Employee.objects.only('id'), pk=pk)
+            messages.info(
+                request,
+                _('This document has already been deleted.')
+            )
+        return HttpResponseRedirect(documents_url)
+
+    # English: Employee is only used for the confirm template
+    employee = get_object_or_404(Employee.objects.only('id'), pk=pk)
 
     # English: Try to get document, handle case when already deleted
-    try:
-        document = EmployeeDocument.objects.get(pk=doc_pk, employee=employee)
-    except EmployeeDocument.DoesNotExist:
+    document = documents.only('id', 'title', 'file', 'employee_id').first()
+    if document is None:
         # English: Document already deleted (user pressed Back button)
         messages.info(
             request,
             _('This document has already been deleted.')
         )
-        url = reverse('employees:employee_detail', kwargs={
-                      'pk': employee.pk}) + '?tab=documents'
-        return HttpResponseRedirect(url)
-
-    if request.method == 'POST':
-        document.delete()
-        messages.success(request, _('Document deleted successfully.'))
-        url = reverse('employees:employee_detail', kwargs={
-                      'pk': employee.pk}) + '?tab=documents'
-        return HttpResponseRedirect(url)
+        return HttpResponseRedirect(documents_url)
 
     return render(request, 'employees/document_confirm_delete.html', {
         'document': document,
@@ -2468,7 +2819,7 @@ def employee_document_delete(request, pk, doc_pk):
         'page_title': _('Delete Document'),
         'delete_title': _('Delete Document?'),
         'confirm_text': _('Delete Document'),
-        'cancel_url': reverse('employees:employee_detail', kwargs={'pk': employee.pk}) + '?tab=documents',
+        'cancel_url': documents_url,
     })
 
 
@@ -2563,17 +2914,19 @@ class LocationListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permiss
     permission_required = 'employees.view_location'
     filterset_class = LocationFilterSet
 
+    _ACTION_ADD = {'label': _('Add Location'), 'icon': 'add', 'style': 'primary'}
+
     def get_breadcrumbs(self):
         """Breadcrumbs for location list."""
         return [
-            {'label': _('Dashboard'), 'url': reverse('dashboard:home')},
-            {'label': _('Employees'), 'url': reverse('employees:employee_list')},
+            {'label': _('Dashboard'), 'url': _static_url('dashboard:home')},
+            {'label': _('Employees'), 'url': _static_url('employees:employee_list')},
             {'label': _('Locations'), 'url': None},
         ]
 
     def get_queryset(self):
         """Optimize query with annotations and relations."""
-        queryset = super().get_queryset()
+        queryset = self.get_filtered_queryset()
 
         # English: Add employee counts via annotation
         queryset = queryset.annotate(
@@ -2582,53 +2935,58 @@ class LocationListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permiss
             inactive_employees=Count('employees', filter=Q(employees__is_active=False))
         )
 
-        # English: Optimize manager lookup
-        queryset = queryset.select_related('manager')
+        # English: Manager name computed in SQL (same rules as User.get_full_name) -
+        # avoids joining the whole user row just for display
+        queryset = queryset.annotate(
+            manager_full_name=Coalesce(
+                NullIf(Trim(Concat('manager__first_name', Value(' '), 'manager__last_name')), Value('')),
+                'manager__email',
+                output_field=CharField(),
+            )
+        )
+
+        # English: country_flag reads address_detail
+        queryset = queryset.select_related('address_detail')
+
+        # English: Only the columns the table renders - skips description,
+        # labor_budget, coordinates and the contact fields
+        queryset = queryset.only(
+            'id', 'code', 'name', 'city', 'address', 'address_line_2',
+            'postal_code', 'state_province', 'country', 'is_active',
+            'address_detail__country',
+        )
 
         return queryset.order_by('name')
 
+    def get_stats_queryset(self):
+        """
+        Filtered locations without the table annotations.
+        English: Stats aggregate over plain rows - no employees JOIN/GROUP BY
+        and no manager JOIN.
+        """
+        return self.get_filtered_queryset()
+
     def _produce_stats(self, queryset):
         """
         Compute statistics based on filtered queryset.
         English: Uses the filtered queryset passed as parameter.
         """
-        # Calculate stats on filtered queryset
-        total = queryset.count()
-        active = queryset.filter(is_active=True).count()
-        inactive = total - active
-        with_manager = queryset.filter(manager__isnull=False).count()
+        # Calculate stats on filtered queryset in a single aggregate query
+        counts = queryset.aggregate(
+            total=Count('pk'),
+            active=Count('pk', filter=Q(is_active=True)),
+            with_manager=Count('pk', filter=Q(manager__isnull=False)),
+        )
+        counts['inactive'] = counts['total'] - counts['active']
 
-        return [
-            {
-                'title': _('Total Locations'),
-                'value': total,
-                'icon': 'location_on',
-                'bg_color': 'primary'
-            },
-            {
-                'title': _('Active'),
-                'value': active,
-                'icon': 'check_circle',
-                'bg_color': 'success'
-            },
-            {
-                'title': _('Inactive'),
-                'value': inactive,
-                'icon': 'cancel',
-                'bg_color': 'danger'
-            },
-            {
-                'title': _('With Manager'),
-                'value': with_manager,
-                'icon': 'person',
-                'bg_color': 'info'
-            },
-        ]
+        return [dict(card, value=counts[key]) for key, card in _LOCATION_STATS_CARDS]
 
     def get_statistics(self, queryset):
         """Get statistics with caching based on filtered queryset."""
-        params_hash = make_params_hash(self.request.GET)
-        key = make_key('stats', 'employees', 'location_list', 'global', params_hash)
+        params_hash = make_params_hash(self.request.GET, exclude=PAGINATION_PARAMS)
+        version = get_stats_version('location_list')
+        key = make_key('stats', 'employees', 'location_list',
+                       f'v{version}', 'global', params_hash)
         return get_or_set_stats(key, lambda: self._produce_stats(queryset))
 
     def prepare_table_rows(self, locations):
@@ -2637,37 +2995,38 @@ class LocationListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permiss
         English: Convert QuerySet to structured dict with cells for templates.
         """
         table_rows = []
+        detail_url = pk_url_template('employees:location_detail')
+        edit_url = pk_url_template('employees:location_update')
+        # English: Per-request memo by country code - few distinct countries per page
+        flag_cache = {}
 
         for loc in locations:
-            manager_display = loc.manager.get_full_name() if loc.manager else '—'
+            status_text, status_color = STATUS_BADGE[loc.is_active]
+            manager_display = loc.manager_full_name or '—'
 
             # Build address for badge name: address, address_line_2, postal_code
-            address_parts = []
-            if loc.address:
-                address_parts.append(loc.address)
-            if loc.address_line_2:
-                address_parts.append(loc.address_line_2)
-            if loc.postal_code:
-                address_parts.append(loc.postal_code)
-
-            address_display = ", ".join(address_parts) if address_parts else "—"
+            address_display = ", ".join(
+                filter(None, (loc.address, loc.address_line_2, loc.postal_code))
+            ) or "—"
 
             # Build subtitle: state, country
-            subtitle_parts = []
-            if loc.state_province:
-                subtitle_parts.append(loc.state_province)
-            if loc.country:
-                subtitle_parts.append(loc.get_country_display())
+            address_subtitle = ", ".join(filter(None, (
+                loc.state_province,
+                str(_LOCATION_COUNTRY_NAMES.get(loc.country, loc.country)) if loc.country else None,
+            )))
 
-            address_subtitle = ", ".join(subtitle_parts) if subtitle_parts else ""
+            flag_code = loc.address_detail.country if loc.address_detail else loc.country
+            flag = flag_cache.get(flag_code)
+            if flag is None:
+                flag = flag_cache[flag_code] = loc.country_flag or '🌍'
 
             table_rows.append({
                 'id': loc.id,
                 'cells': [
                     {
                         'type': 'badge',
-                        'text': _('Active') if loc.is_active else _('Inactive'),
-                        'color': 'success' if loc.is_active else 'secondary',
+                        'text': status_text,
+                        'color': status_color,
                         'subtitle': loc.code
                     },
                     {
@@ -2678,7 +3037,7 @@ class LocationListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permiss
                     },
                     {
                         'type': 'icon',
-                        'icon': loc.country_flag or '🌍',
+                        'icon': flag,
                         'name': address_display,
                         'subtitle': address_subtitle
                     },
@@ -2699,20 +3058,8 @@ class LocationListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permiss
                     {
                         'type': 'actions',
                         'actions': [
-                            {
-                                'type': 'link',
-                                'url': loc.get_absolute_url(),
-                                'icon': 'visibility',
-                                'title': _('View'),
-                                'color': 'primary'
-                            },
-                            {
-                                'type': 'link',
-                                'url': loc.get_edit_url(),
-                                'icon': 'edit',
-                                'title': _('Edit'),
-                                'color': 'secondary'
-                            }
+                            dict(VIEW_ACTION, url=detail_url.format(loc.pk)),
+                            dict(EDIT_ACTION, url=edit_url.format(loc.pk)),
                         ]
                     }
                 ]
@@ -2720,10 +3067,25 @@ class LocationListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permiss
 
         return table_rows
 
+    def get_table_rows(self, locations, page_obj):
+        """
+        Table rows cached per filters, page and language.
+        English: Rows carry location fields, address flags, employee counts and
+        manager names, so the key includes both list versions and the user version
+        (Address writes bump the location list version).
+        """
+        locations_ver, employees_ver, users_ver = get_stats_versions(
+            'location_list', 'employee_list', 'users')
+        key = make_key('rows', 'employees', 'location_list',
+                       f"v{locations_ver}", f"e{employees_ver}", f"u{users_ver}",
+                       make_params_hash(self.request.GET),
+                       page_obj.number if page_obj else 1, get_language())
+        return get_or_set_stats(key, lambda: self.prepare_table_rows(locations))
+
     def get_context_data(self, **kwargs):
         """Add extra context for template."""
         # Get full filtered queryset BEFORE pagination for statistics
-        full_queryset = self.get_queryset()
+        full_queryset = self.get_stats_queryset()
 
         # Now call super() which will paginate the queryset
         ctx = super().get_context_data(**kwargs)
@@ -2731,51 +3093,37 @@ class LocationListView(FilterMixin, BreadcrumbMixin, LoginRequiredMixin, Permiss
         # English: Page header data
         ctx['page_title'] = _('Locations')
         ctx['page_subtitle'] = _('Manage clinic and office locations')
-        ctx['create_url'] = reverse('employees:location_create')
-        ctx['back_url'] = reverse('employees:employee_list')
+        ctx['create_url'] = _static_url('employees:location_create')
+        ctx['back_url'] = _static_url('employees:employee_list')
 
         # English: Header actions
-        ctx['header_actions'] = [
-            {
-                'label': _('Add Location'),
-                'icon': 'add',
-                'href': ctx['create_url'],
-                'style': 'primary'
-            }
-        ]
+        ctx['header_actions'] = [dict(self._ACTION_ADD, href=ctx['create_url'])]
 
         # English: Statistics cards based on full filtered queryset (before pagination)
         ctx['stats_cards'] = self.get_statistics(full_queryset)
 
         # English: Table configuration
-        ctx['table_columns'] = [
-            {'title': _('Status'), 'width': '10%'},
-            {'title': _('Name'), 'width': '20%'},
-            {'title': _('Address'), 'width': '25%'},
-            {'title': _('Manager'), 'width': '15%'},
-            {'title': _('Active employees'), 'align': 'center', 'width': '10%'},
-            {'title': _('Total employees'), 'align': 'center', 'width': '10%'},
-            {'title': _('Actions'), 'width': '10%'}
-        ]
-        ctx['table_rows'] = self.prepare_table_rows(ctx['locations'])
-
-        # English: Empty state config
-        if ctx.get('has_active_filters'):
-            ctx['empty_state_config'] = {
-                'icon': 'filter_alt_off',
-                'title': _('No locations match your filters'),
-                'message': _('Try adjusting or clearing your filters to see more results'),
-                'button_text': _('Clear Filters'),
-                'button_url': ctx.get('action_url', reverse('employees:location_list'))
-            }
-        else:
-            ctx['empty_state_config'] = {
-                'icon': 'location_on',
-                'title': _('No locations found'),
-                'message': _('Start by adding your first clinic location'),
-                'button_text': _('Add First Location'),
-                'button_url': reverse('employees:location_create')
-            }
+        ctx['table_columns'] = list(_LOCATION_TABLE_COLUMNS)
+        ctx['table_rows'] = self.get_table_rows(ctx['locations'], ctx.get('page_obj'))
+
+        # English: Empty state config - data_table only renders it without rows
+        if not ctx['table_rows']:
+            if ctx.get('has_active_filters'):
+                ctx['empty_state_config'] = {
+                    'icon': 'filter_alt_off',
+                    'title': _('No locations match your filters'),
+                    'message': _('Try adjusting or clearing your filters to see more results'),
+                    'button_text': _('Clear Filters'),
+                    'button_url': ctx.get('action_url', _static_url('employees:location_list'))
+                }
+            else:
+                ctx['empty_state_config'] = {
+                    'icon': 'location_on',
+                    'title': _('No locations found'),
+                    'message': _('Start by adding your first clinic location'),
+                    'button_text': _('Add First Location'),
+                    'button_url': _static_url('employees:location_create')
+                }
 
         return ctx
 
@@ -2788,71 +3136,36 @@ class LocationDetailView(EmployeeTableMixin, BreadcrumbMixin, LoginRequiredMixin
     context_object_name = 'location'
     permission_required = 'employees.view_location'
 
+    _ACTION_EDIT = {'label': _('Edit'), 'icon': 'edit', 'style': 'secondary'}
+    _ACTION_DELETE = {'label': _('Delete'), 'icon': 'delete', 'style': 'danger'}
+
     def get_breadcrumbs(self):
         """Breadcrumbs for location detail."""
         return [
-            {'label': _('Dashboard'), 'url': reverse('dashboard:home')},
-            {'label': _('Employees'), 'url': reverse('employees:employee_list')},
-            {'label': _('Locations'), 'url': reverse('employees:location_list')},
+            {'label': _('Dashboard'), 'url': _static_url('dashboard:home')},
+            {'label': _('Employees'), 'url': _static_url('employees:employee_list')},
+            {'label': _('Locations'), 'url': _static_url('employees:location_list')},
             {'label': self.object.name, 'url': None},
         ]
 
     def get_header_actions(self):
         """Prepare header actions for page_header component."""
         return [
-            {
-                'label': _('Edit'),
-                'icon': 'edit',
-                'href': self.object.get_edit_url(),
-                'style': 'secondary'
-            },
-            {
-                'label': _('Delete'),
-                'icon': 'delete',
-                'href': self.object.get_delete_url(),
-                'style': 'danger'
-            }
+            dict(self._ACTION_EDIT, href=self.object.get_edit_url()),
+            dict(self._ACTION_DELETE, href=self.object.get_delete_url()),
         ]
 
     def get_queryset(self):
         """Optimize query."""
         return super().get_queryset().select_related('manager').annotate(
             total_employees=Count('employees'),
-            active_employees=Count('employees', filter=Q(employees__is_active=True))
+            active_employees=Count('employees', filter=Q(employees__is_active=True)),
+            inactive_employees=Count('employees', filter=Q(employees__is_active=False))
         )
 
-    def get_context_data(self, **kwargs):
-        """Prepare context for detail view."""
-        ctx = super().get_context_data(**kwargs)
-        loc = self.object
-
-        # English: Page header
-        ctx['page_title'] = loc.name
-        ctx['page_subtitle'] = _('Location Code: %(code)s') % {'code': loc.code}
-        ctx['header_actions'] = self.get_header_actions()
-        ctx['back_url'] = reverse('employees:location_list')
-
-        # English: Statistics cards
-        ctx['stats_cards'] = [
-            {
-                'title': _('Total Employees'),
-                'value': loc.employee_count,
-                'icon': 'people',
-                'bg_color': 'primary'
-            },
-            {
-                'title': _('Active Employees'),
-                'value': loc.active_employee_count,
-                'icon': 'check_circle',
-                'bg_color': 'success'
-            },
-            {
-                'title': _('Inactive Employees'),
-                'value': loc.inactive_employee_count,
-                'icon': 'cancel',
-                'bg_color': 'secondary'
-            },
-        ]
+    def get_sidebar_blocks(self, loc):
+        """Build sidebar blocks configuration (new component blocks system)."""
+        manager_name = loc.manager.get_full_name() if loc.manager else '—'
 
         # English: Status badge
         status_badge = {
@@ -2928,7 +3241,7 @@ class LocationDetailView(EmployeeTableMixin, BreadcrumbMixin, LoginRequiredMixin
             })
 
         # Add geolocation if present
-        if loc.latitude and loc.longitude:
+        if loc.latitude is not None and loc.longitude is not None:
             geo_url = f"https://www.google.com/maps?q={loc.latitude},{loc.longitude}"
             sidebar_blocks.append({
                 'type': 'field',
@@ -2976,13 +3289,13 @@ class LocationDetailView(EmployeeTableMixin, BreadcrumbMixin, LoginRequiredMixin
                 'type': 'field',
                 'icon': 'person',
                 'label': _('Manager'),
-                'value': loc.manager.get_full_name() if loc.manager else '—'
+                'value': manager_name
             },
             {
                 'type': 'field',
                 'icon': 'account_balance_wallet',
                 'label': _('Labor Budget'),
-                'value': f"CHF {loc.labor_budget:,.2f}" if loc.labor_budget else '—'
+                'value': f"CHF {loc.labor_budget:,.2f}" if loc.labor_budget is not None else '—'
             }
         ])
 
@@ -3003,7 +3316,25 @@ class LocationDetailView(EmployeeTableMixin, BreadcrumbMixin, LoginRequiredMixin
                 }
             ])
 
-        ctx['sidebar_blocks'] = sidebar_blocks
+        return sidebar_blocks
+
+    def get_context_data(self, **kwargs):
+        """Prepare context for detail view."""
+        ctx = super().get_context_data(**kwargs)
+        loc = self.object
+
+        # English: Page header
+        ctx['page_title'] = loc.name
+        ctx['page_subtitle'] = _('Location Code: %(code)s') % {'code': loc.code}
+        ctx['header_actions'] = self.get_header_actions()
+        ctx['back_url'] = _static_url('employees:location_list')
+
+        # English: Statistics cards (counts annotated in get_queryset)
+        ctx['stats_cards'] = [
+            dict(card, value=getattr(loc, attr)) for attr, card in _LOCATION_DETAIL_STATS_CARDS
+        ]
+
+        ctx['sidebar_blocks'] = self.get_sidebar_blocks(loc)
 
         # English: Tabs configuration
         ctx['tabs'] = [
@@ -3018,9 +3349,7 @@ class LocationDetailView(EmployeeTableMixin, BreadcrumbMixin, LoginRequiredMixin
         ctx['active_tab'] = self.request.GET.get('tab', 'employees')
 
         # English: Employees list (main content - right column)
-        employees = loc.employees.select_related(
-            'user', 'position', 'department'
-        ).order_by('user__first_name', 'user__last_name')
+        employees = self.get_employee_table_queryset().filter(location=loc)
 
         # English: Content blocks configuration (new component blocks system)
         content_blocks = [
@@ -3051,64 +3380,18 @@ class LocationFormMixin:
 
     def get_form_sections(self, form):
         """Return list of sections for component-based rendering."""
-        return [
-            {
-                'title': _('Basic Information'),
-                'icon': 'info',
-                'fields': [
-                    {'field': form['name'], 'col_class': 'col-md-6'},
-                    {
-                        'field': form['code'],
-                        'col_class': 'col-md-6',
-                        'has_toggle': True,
-                        'toggle_field': form['is_active'],
-                    },
-                ]
-            },
-            {
-                'title': _('Address'),
-                'icon': 'location_on',
-                'fields': [
-                    {'field': form['address'], 'col_class': 'col-12'},
-                    {'field': form['address_line_2'], 'col_class': 'col-12'},
-                    {'field': form['city'], 'col_class': 'col-md-4'},
-                    {'field': form['postal_code'], 'col_class': 'col-md-3'},
-                    {'field': form['state_province'], 'col_class': 'col-md-2'},
-                    {'field': form['country'], 'col_class': 'col-md-3'},
-                ]
-            },
-            {
-                'title': _('Contact Information'),
-                'icon': 'contact_phone',
-                'fields': [
-                    {'field': form['phone'], 'col_class': 'col-md-6'},
-                    {'field': form['email'], 'col_class': 'col-md-6'},
-                ]
-            },
-            {
-                'title': _('Management'),
-                'icon': 'admin_panel_settings',
-                'fields': [
-                    {'field': form['manager'], 'col_class': 'col-md-6'},
-                    {'field': form['labor_budget'], 'col_class': 'col-md-6'},
-                ]
-            },
-            {
-                'title': _('Geolocation (Optional)'),
-                'icon': 'map',
-                'fields': [
-                    {'field': form['latitude'], 'col_class': 'col-md-6'},
-                    {'field': form['longitude'], 'col_class': 'col-md-6'},
-                ]
-            },
-            {
-                'title': _('Additional Information'),
-                'icon': 'notes',
-                'fields': [
-                    {'field': form['description'], 'col_class': 'col-12'},
-                ]
-            }
-        ]
+        # English: Static schema lives at module level - only bound fields are per form
+        sections = []
+        for title, icon, fields in _LOCATION_FORM_SECTIONS:
+            section_fields = []
+            for name, col_class, toggle_name in fields:
+                field = {'field': form[name], 'col_class': col_class}
+                if toggle_name:
+                    field['has_toggle'] = True
+                    field['toggle_field'] = form[toggle_name]
+                section_fields.append(field)
+            sections.append({'title': title, 'icon': icon, 'fields': section_fields})
+        return sections
 
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
@@ -3142,7 +3425,7 @@ class LocationFormMixin:
     def get_success_url(self):
         if getattr(self, 'object', None):
             return reverse('employees:location_detail', kwargs={'pk': self.object.pk})
-        return reverse('employees:location_list')
+        return _static_url('employees:location_list')
 
 
 # ============================================
@@ -3157,9 +3440,9 @@ class LocationCreateView(LocationFormMixin, BreadcrumbMixin, LoginRequiredMixin,
     def get_breadcrumbs(self):
         """Breadcrumbs for location create."""
         return [
-            {'label': _('Dashboard'), 'url': reverse('dashboard:home')},
-            {'label': _('Employees'), 'url': reverse('employees:employee_list')},
-            {'label': _('Locations'), 'url': reverse('employees:location_list')},
+            {'label': _('Dashboard'), 'url': _static_url('dashboard:home')},
+            {'label': _('Employees'), 'url': _static_url('employees:employee_list')},
+            {'label': _('Locations'), 'url': _static_url('employees:location_list')},
             {'label': _('Create'), 'url': None},
         ]
 
@@ -3182,9 +3465,9 @@ class LocationUpdateView(LocationFormMixin, BreadcrumbMixin, LoginRequiredMixin,
     def get_breadcrumbs(self):
         """Breadcrumbs for location update."""
         return [
-            {'label': _('Dashboard'), 'url': reverse('dashboard:home')},
-            {'label': _('Employees'), 'url': reverse('employees:employee_list')},
-            {'label': _('Locations'), 'url': reverse('employees:location_list')},
+            {'label': _('Dashboard'), 'url': _static_url('dashboard:home')},
+            {'label': _('Employees'), 'url': _static_url('employees:employee_list')},
+            {'label': _('Locations'), 'url': _static_url('employees:location_list')},
             {'label': self.object.name, 'url': reverse('employees:location_detail', kwargs={'pk': self.object.pk})},
             {'label': _('Edit'), 'url': None},
         ]
@@ -3210,24 +3493,43 @@ class LocationDeleteView(LoginRequiredMixin, DeleteView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['employee_count'] = self.object.employee_count
-        context['page_title'] = _(f'Delete {self.object.name}')
+        context['page_title'] = _('Delete %(name)s') % {'name': self.object.name}
         # Breadcrumbs
         context['items'] = [
             {'label': 'Home', 'url': '/'},
-            {'label': 'Locations', 'url': reverse('employees:location_list')},
+            {'label': 'Locations', 'url': _static_url('employees:location_list')},
             {'label': self.object.name},  # Active item (no URL)
         ]
         return context
 
-    def delete(self, request, *args, **kwargs):
-        location = self.get_object()
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.method != 'GET':
+            # English: Soft delete only needs the pk and the name for the message
+            queryset = queryset.only('id', 'name')
+        return queryset
 
-        # Soft delete - just deactivate
-        location.is_active = False
-        location.save()
+    def deactivate(self):
+        """
+        Soft delete - just deactivate.
+        English: A single UPDATE of the flag. update() bypasses save() and its
+        signals, so updated_at and the location stats version are set here.
+        """
+        Location.objects.filter(pk=self.object.pk).update(
+            is_active=False, updated_at=timezone.now()
+        )
+        bump_stats_version('location_list')
 
         messages.success(
-            request,
-            _('Location "{}" has been deactivated.').format(location.name)
+            self.request,
+            _('Location "%(name)s" has been deactivated.') % {'name': self.object.name}
         )
         return HttpResponseRedirect(self.success_url)
+
+    def form_valid(self, form):
+        """POST path of DeleteView - deactivate instead of deleting."""
+        return self.deactivate()
+
+    def delete(self, request, *args, **kwargs):
+        self.object = self.get_object()
+        return self.deactivate()
@@ -91,6 +91,9 @@ DATABASES = {
         'PASSWORD': env('DB_PASSWORD', default='dev_password'),
         'HOST': env('DB_HOST', default='localhost'),
         'PORT': env('DB_PORT', default='15432'),
+        # Reuse connections across requests; health check drops stale ones
+        'CONN_MAX_AGE': env.int('DB_CONN_MAX_AGE', default=60),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 